@@ -1,19 +1,63 @@
+from functools import cache
 from urllib.parse import urljoin
 
 from django.conf import settings
-from django.http import JsonResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
 from django.urls import reverse
 from rest_framework import serializers
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
 from wagtail.api.conf import APIField
 from wagtail.api.v2.router import WagtailAPIRouter
 from wagtail.api.v2.views import PagesAPIViewSet
 from wagtail.documents.api.v2.views import DocumentsAPIViewSet
 from wagtail.images.api.v2.views import ImagesAPIViewSet
+from wagtail.models import PageViewRestriction
 
 from govuk.authentication import InternalAccessJWTAuthentication
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module when orjson is unavailable.
+    orjson = None
+
 AUTH_QUERY_PARAMETERS = frozenset({"bearer"})
+PRIVACY_ATTR = "api_privacy"
+
+
+def attach_page_privacy(pages):
+    """
+    Attach the PagePrivacyField payload to each page as `api_privacy`.
+
+    All restrictions and their groups are read with a single values query,
+    so listings avoid building restriction and group model instances.
+    """
+    restrictions_by_page = {}
+    rows = (
+        PageViewRestriction.objects.filter(page_id__in=[page.pk for page in pages])
+        .order_by("page_id", "id", "groups__id")
+        .values_list("page_id", "id", "restriction_type", "groups__id", "groups__name")
+    )
+    for page_id, restriction_id, restriction_type, group_id, group_name in rows:
+        restrictions = restrictions_by_page.setdefault(page_id, {})
+        restriction = restrictions.get(restriction_id)
+        if restriction is None:
+            restriction = {"id": restriction_id, "type": restriction_type}
+            if restriction_type == PageViewRestriction.GROUPS:
+                restriction["groups"] = []
+            restrictions[restriction_id] = restriction
+        if group_id is not None and "groups" in restriction:
+            restriction["groups"].append({"id": group_id, "name": group_name})
+
+    for page in pages:
+        restrictions = restrictions_by_page.get(page.pk)
+        if restrictions:
+            privacy = {"restricted": True, "restrictions": list(restrictions.values())}
+        else:
+            privacy = {"restricted": False, "restrictions": []}
+        setattr(page, PRIVACY_ATTR, privacy)
+    return pages
 
 
 class PagePrivacyField(serializers.Field):
@@ -23,28 +67,36 @@ class PagePrivacyField(serializers.Field):
         super().__init__(**kwargs)
 
     def to_representation(self, page):
-        restrictions = []
-        for restriction in page.view_restrictions.all():
-            restriction_data = {
-                "id": restriction.id,
-                "type": restriction.restriction_type,
-            }
-            if restriction.restriction_type == restriction.GROUPS:
-                restriction_data["groups"] = [
-                    {"id": group.id, "name": group.name}
-                    for group in restriction.groups.all()
-                ]
-            restrictions.append(restriction_data)
-
-        return {
-            "restricted": bool(restrictions),
-            "restrictions": restrictions,
-        }
+        try:
+            return getattr(page, PRIVACY_ATTR)
+        except AttributeError:
+            # Detail and find views serialise a single page fetched outside
+            # the listing.
+            return getattr(attach_page_privacy([page])[0], PRIVACY_ATTR)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Render API responses with orjson.
+
+    Wagtail's API views always request indented output, which orjson only
+    supports with a two-space indent.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        option = orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=self.encoder_class().default, option=option)
 
 
 class AuthenticatedAPIViewSetMixin:
     authentication_classes = [InternalAccessJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
 
 class WagtailPages(AuthenticatedAPIViewSetMixin, PagesAPIViewSet):
@@ -57,8 +109,11 @@ class WagtailPages(AuthenticatedAPIViewSetMixin, PagesAPIViewSet):
         AUTH_QUERY_PARAMETERS
     )
 
-    def get_queryset(self):
-        return super().get_queryset().prefetch_related("view_restrictions__groups")
+    def paginate_queryset(self, queryset):
+        pages = super().paginate_queryset(queryset)
+        if pages is None:
+            return None
+        return attach_page_privacy(list(pages))
 
 
 class WagtailImages(AuthenticatedAPIViewSetMixin, ImagesAPIViewSet):
@@ -79,10 +134,23 @@ api_router.register_endpoint("images", WagtailImages)
 api_router.register_endpoint("documents", WagtailDocuments)
 
 
+@cache
+def _v2_endpoint_listing_paths():
+    # URL patterns are fixed once loaded, so resolve the listing paths once.
+    return {
+        endpoint_name: reverse(f"{api_router.url_namespace}:{endpoint_name}:listing")
+        for endpoint_name in api_router._endpoints
+    }
+
+
+@cache
+def _api_v2_root_path():
+    return reverse("api_v2_root")
+
+
 def _build_v2_endpoint_links(request):
     links = {}
-    for endpoint_name in api_router._endpoints:
-        listing_path = reverse(f"{api_router.url_namespace}:{endpoint_name}:listing")
+    for endpoint_name, listing_path in _v2_endpoint_listing_paths().items():
         listing_url = _build_api_absolute_url(request, listing_path)
         links[endpoint_name] = {
             "listing": listing_url,
@@ -98,18 +166,27 @@ def _build_api_absolute_url(request, path):
     return request.build_absolute_uri(path)
 
 
+def _json_response(data):
+    if orjson is None:
+        return JsonResponse(data)
+    return HttpResponse(
+        orjson.dumps(data, default=DjangoJSONEncoder().default),
+        content_type="application/json",
+    )
+
+
 def api_root_view(request):
-    return JsonResponse(
+    return _json_response(
         {
             "versions": {
-                "v2": _build_api_absolute_url(request, reverse("api_v2_root")),
+                "v2": _build_api_absolute_url(request, _api_v2_root_path()),
             }
         }
     )
 
 
 def api_v2_root_view(request):
-    return JsonResponse(
+    return _json_response(
         {
             "version": "v2",
             "endpoints": _build_v2_endpoint_links(request),
@@ -1,18 +1,19 @@
 import logging
 
-from django.apps import AppConfig
-from django.db.models.signals import post_migrate
+from django.apps import AppConfig, apps
+from django.db.models.signals import (
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+)
 
+from govuk.settings.base import sync_admin_users_from_env
 
 logger = logging.getLogger(__name__)
 
 
 def _sync_admin_users_after_migrate(app_config, **kwargs):
-    if app_config.label != "auth":
-        return
-
-    from govuk.settings.base import sync_admin_users_from_env
-
     results = sync_admin_users_from_env()
     if results["created"] or results["updated"]:
         logger.info(
@@ -27,7 +28,79 @@ class GovukConfig(AppConfig):
     verbose_name = "GOV.UK"
 
     def ready(self):
+        from wagtail.models import Site
+        from wagtail.signals import post_page_move
+
+        from govuk.context_processors import (
+            invalidate_navigation_cache,
+            invalidate_navigation_cache_for_page,
+        )
+        from govuk.models import GovukTag
+        from govuk.search_backend import (
+            collect_external_items_for_tag_delete,
+            invalidate_search_cache,
+            invalidate_search_cache_for_instance,
+            update_external_search_vectors_after_tag_delete,
+            update_external_search_vectors_for_instance,
+        )
+
+        # Only run once auth has migrated, rather than for every app.
         post_migrate.connect(
             _sync_admin_users_after_migrate,
+            sender=apps.get_app_config("auth"),
             dispatch_uid="govuk.sync_admin_users_after_migrate",
         )
+
+        # Page signals are sent with the specific page class as sender, so
+        # listen to all senders and filter on the instance.
+        post_save.connect(
+            invalidate_navigation_cache_for_page,
+            dispatch_uid="govuk.invalidate_navigation_cache_on_page_save",
+        )
+        post_delete.connect(
+            invalidate_navigation_cache_for_page,
+            dispatch_uid="govuk.invalidate_navigation_cache_on_page_delete",
+        )
+        post_page_move.connect(
+            invalidate_navigation_cache,
+            dispatch_uid="govuk.invalidate_navigation_cache_on_page_move",
+        )
+        post_save.connect(
+            invalidate_navigation_cache,
+            sender=Site,
+            dispatch_uid="govuk.invalidate_navigation_cache_on_site_save",
+        )
+
+        # Search results embed page, tag and external content data, so any
+        # change to those retires the cached result lists.
+        post_save.connect(
+            update_external_search_vectors_for_instance,
+            dispatch_uid="govuk.update_external_search_vectors_on_save",
+        )
+        pre_delete.connect(
+            collect_external_items_for_tag_delete,
+            sender=GovukTag,
+            dispatch_uid="govuk.collect_external_items_on_tag_delete",
+        )
+        post_delete.connect(
+            update_external_search_vectors_after_tag_delete,
+            sender=GovukTag,
+            dispatch_uid="govuk.update_external_search_vectors_on_tag_delete",
+        )
+        post_save.connect(
+            invalidate_search_cache_for_instance,
+            dispatch_uid="govuk.invalidate_search_cache_on_save",
+        )
+        post_delete.connect(
+            invalidate_search_cache_for_instance,
+            dispatch_uid="govuk.invalidate_search_cache_on_delete",
+        )
+        post_page_move.connect(
+            invalidate_search_cache,
+            dispatch_uid="govuk.invalidate_search_cache_on_page_move",
+        )
+        post_save.connect(
+            invalidate_search_cache,
+            sender=Site,
+            dispatch_uid="govuk.invalidate_search_cache_on_site_save",
+        )
@@ -1,8 +1,21 @@
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
 from datetime import timedelta
 
+from jwt import PyJWKClient
 from rest_framework_simplejwt.exceptions import InvalidToken
 from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
-from rest_framework_simplejwt.utils import aware_utcnow, datetime_from_epoch
+from rest_framework_simplejwt.state import token_backend
+
+# Keep parsed signing keys between requests rather than rebuilding them from
+# the cached JWK set each time a token is verified.
+if token_backend.jwks_client is not None:
+    token_backend.jwks_client = PyJWKClient(
+        token_backend.jwks_client.uri, cache_keys=True
+    )
 
 
 class InternalAccessJWTAuthentication(JWTStatelessUserAuthentication):
@@ -11,31 +24,65 @@ class InternalAccessJWTAuthentication(JWTStatelessUserAuthentication):
 
     Verification is configured through the SIMPLE_JWT settings in
     govuk/settings/base.py (JWKS URL, issuer, and audience).
+
+    Successfully validated tokens are cached per process until the earlier of
+    their 'exp' claim and the maximum ID token age, so repeat requests with the
+    same token skip signature verification.
     """
 
     token_query_param = "bearer"
     max_id_token_age = timedelta(hours=12)
+    max_id_token_age_seconds = max_id_token_age.total_seconds()
+    validated_token_cache_size = 256
+
+    _validated_tokens = OrderedDict()
+    _validated_tokens_lock = threading.Lock()
 
     def get_validated_token(self, raw_token):
+        cache_key = hashlib.blake2b(raw_token, digest_size=16).digest()
+        now = time.time()
+        with self._validated_tokens_lock:
+            cached = self._validated_tokens.get(cache_key)
+            if cached is not None:
+                validated_token, expires_at = cached
+                if now < expires_at:
+                    self._validated_tokens.move_to_end(cache_key)
+                    return validated_token
+                del self._validated_tokens[cache_key]
+
         validated_token = super().get_validated_token(raw_token)
-        self._validate_id_token_age(validated_token)
+        issued_at = self._validate_id_token_age(validated_token, now)
+
+        expires_at = issued_at + self.max_id_token_age_seconds
+        try:
+            expires_at = min(expires_at, float(validated_token["exp"]))
+        except (KeyError, TypeError, ValueError):
+            pass
+        with self._validated_tokens_lock:
+            self._validated_tokens[cache_key] = (validated_token, expires_at)
+            while len(self._validated_tokens) > self.validated_token_cache_size:
+                self._validated_tokens.popitem(last=False)
         return validated_token
 
-    def _validate_id_token_age(self, validated_token):
+    def _validate_id_token_age(self, validated_token, now=None):
         issued_at_epoch = validated_token.get("iat")
         if issued_at_epoch is None:
             raise InvalidToken("Token has no 'iat' claim")
 
         try:
-            issued_at = datetime_from_epoch(float(issued_at_epoch))
-        except (TypeError, ValueError, OverflowError, OSError) as exc:
+            issued_at = float(issued_at_epoch)
+        except (TypeError, ValueError, OverflowError) as exc:
             raise InvalidToken("Token has invalid 'iat' claim") from exc
+        if not math.isfinite(issued_at):
+            raise InvalidToken("Token has invalid 'iat' claim")
 
-        now = aware_utcnow()
+        if now is None:
+            now = time.time()
         if issued_at > now:
             raise InvalidToken("Token 'iat' claim is in the future")
-        if now - issued_at >= self.max_id_token_age:
+        if now - issued_at >= self.max_id_token_age_seconds:
             raise InvalidToken("Token is older than the maximum allowed 12 hours")
+        return issued_at
 
     def authenticate(self, request):
         authenticated = super().authenticate(request)
@@ -1,25 +1,64 @@
 from __future__ import annotations
 
+import io
 import json
-import ssl
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from html import unescape
-from typing import Iterable
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from http import HTTPStatus
+from itertools import batched
+from typing import IO, Iterable, Iterator
 from xml.etree import ElementTree
 
-from django.utils import timezone
-from django.utils.dateparse import parse_datetime
+import requests
+from django.db import close_old_connections, connections, transaction
+from requests.adapters import HTTPAdapter
 
-from govuk.models import ContentDiscoverySource, ExternalContentItem
+from govuk.models import ContentDiscoverySource, ExternalContentItem, canonical_url
+from govuk.search_backend import invalidate_search_cache
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module when orjson is unavailable.
+    orjson = None
 
 ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
 GITHUB_ORG_API_PREFIX = "https://api.github.com/orgs/"
 USER_AGENT = "wagtail-govuk-content-discovery/1.0"
+UPSERT_BATCH_SIZE = 500
+URL_LOOKUP_BATCH_SIZE = 500
+EMPTY_METADATA_VALUES = (None, "", [], {})
+SYNC_MAX_WORKERS = 8
+# Stored item fields compared with each entry to find changed search text.
+SEARCH_TEXT_FIELDS = ("url", "title", "summary", "source_id")
+UPSERT_UPDATE_FIELDS = [
+    "source",
+    "title",
+    "summary",
+    "published_at",
+    "created_at",
+    "updated_at",
+    "metadata",
+    "last_seen_at",
+]
+
+
+def _build_http_session() -> requests.Session:
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    # Keep one pooled connection per sync worker so keep-alive and TLS
+    # sessions are reused across sources on the same host.
+    adapter = HTTPAdapter(pool_maxsize=SYNC_MAX_WORKERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+HTTP_SESSION = _build_http_session()
 
 
 class ContentDiscoveryError(RuntimeError):
@@ -50,6 +89,15 @@ class SourceSyncResult:
     created: int = 0
     updated: int = 0
     skipped: int = 0
+    not_modified: bool = False
+
+
+@dataclass(slots=True)
+class FetchedSourceContent:
+    body: bytes
+    etag: str = ""
+    last_modified: str = ""
+    not_modified: bool = False
 
 
 def _local_name(tag: str) -> str:
@@ -62,60 +110,125 @@ def _qualified_name(name: str, namespace: str) -> str:
     return f"{{{namespace}}}{name}"
 
 
+# Atom tag names qualified once per supported namespace ("" for feeds that
+# omit the Atom namespace) so the entry loop does no string formatting.
+ATOM_TAGS: dict[str, dict[str, str]] = {
+    namespace: {
+        name: _qualified_name(name, namespace)
+        for name in (
+            "author",
+            "content",
+            "entry",
+            "id",
+            "link",
+            "name",
+            "published",
+            "summary",
+            "title",
+            "updated",
+        )
+    }
+    for namespace in ("", ATOM_NAMESPACE)
+}
+
+# Lower-cased local names of RSS <item> children and the FeedEntry value
+# each one populates.
+RSS_ITEM_FIELDS: dict[str, str] = {
+    "link": "url",
+    "title": "title",
+    "description": "summary",
+    "summary": "summary",
+    "content": "summary",
+    "encoded": "summary",
+    "pubdate": "published_raw",
+    "published": "published_raw",
+    "created": "published_raw",
+    "date": "published_raw",
+    "updated": "updated_raw",
+    "modified": "updated_raw",
+    "guid": "entry_id",
+    "id": "entry_id",
+}
+RSS_AUTHOR_NAMES = frozenset({"author", "creator"})
+
+
 def _element_text(node: ElementTree.Element | None) -> str:
     if node is None:
         return ""
-    text = "".join(node.itertext()).strip()
+    if len(node):
+        text = "".join(node.itertext()).strip()
+    else:
+        # Most feed fields are plain text nodes; skip the itertext generator.
+        text = (node.text or "").strip()
     if not text:
         return ""
     return unescape(text)
 
 
-def _find_text(node: ElementTree.Element, name: str, namespace: str) -> str:
-    return _element_text(node.find(_qualified_name(name, namespace)))
+def _find_text(node: ElementTree.Element, tag: str) -> str:
+    return _element_text(node.find(tag))
 
 
-def _find_text_local_name(node: ElementTree.Element, *names: str) -> str:
-    expected = {name.lower() for name in names}
-    for child in list(node):
-        if _local_name(child.tag) in expected:
+def _rss_item_values(
+    item_node: ElementTree.Element,
+) -> tuple[dict[str, str], list[str]]:
+    # Single pass over the item's children: the first non-empty child wins
+    # for each field, while every author/creator value is collected.
+    values: dict[str, str] = {}
+    author_names: list[str] = []
+    for child in item_node:
+        local_name = _local_name(child.tag)
+        if local_name in RSS_AUTHOR_NAMES:
             value = _element_text(child)
             if value:
-                return value
-    return ""
-
+                author_names.append(value)
+            continue
 
-def _find_all_text_local_name(node: ElementTree.Element, *names: str) -> list[str]:
-    expected = {name.lower() for name in names}
-    values: list[str] = []
-    for child in list(node):
-        if _local_name(child.tag) not in expected:
+        field_name = RSS_ITEM_FIELDS.get(local_name)
+        if field_name is None or field_name in values:
             continue
         value = _element_text(child)
         if value:
-            values.append(value)
-    return values
+            values[field_name] = value
+    return values, author_names
 
 
+# Timestamps repeat heavily within and across feeds; parsed datetimes are
+# immutable, so they can be shared safely.
+@lru_cache(maxsize=4096)
 def _parse_timestamp(value: str) -> datetime | None:
     value = value.strip()
     if not value:
         return None
 
-    dt = parse_datetime(value)
-    if dt is None:
+    # Atom and GitHub timestamps are ISO 8601, which the C implementation of
+    # fromisoformat handles directly; RSS dates fall through to RFC 2822.
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
         try:
             dt = parsedate_to_datetime(value)
         except (TypeError, ValueError, OverflowError):
             return None
 
-    if timezone.is_naive(dt):
-        dt = timezone.make_aware(dt, UTC)
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    if dt.tzinfo is UTC:
+        return dt
     return dt.astimezone(UTC)
 
 
-def _entry_link(entry_node: ElementTree.Element, namespace: str) -> str:
-    link_nodes = entry_node.findall(_qualified_name("link", namespace))
+def _parse_timestamp_pair(
+    created_raw: str, updated_raw: str
+) -> tuple[datetime | None, datetime | None]:
+    created_at = _parse_timestamp(created_raw or updated_raw)
+    if not created_raw or not updated_raw or created_raw == updated_raw:
+        return created_at, created_at
+    return created_at, _parse_timestamp(updated_raw)
+
+
+def _entry_link(entry_node: ElementTree.Element, link_tag: str) -> str:
+    link_nodes = entry_node.findall(link_tag)
     for link_node in link_nodes:
         href = (link_node.attrib.get("href") or "").strip()
         rel = (link_node.attrib.get("rel") or "alternate").strip().lower()
@@ -128,14 +241,34 @@ def _entry_link(entry_node: ElementTree.Element, namespace: str) -> str:
     return ""
 
 
-def _parse_xml_root(xml_content: str | bytes) -> ElementTree.Element:
+def _iter_xml_events(
+    xml_content: str | bytes | IO[bytes],
+) -> Iterator[tuple[str, ElementTree.Element]]:
+    if isinstance(xml_content, bytes):
+        xml_content = io.BytesIO(xml_content)
+    elif isinstance(xml_content, str):
+        xml_content = io.StringIO(xml_content)
+
+    # The C expat parser does not resolve external entities and (from expat
+    # 2.4.1) aborts on entity amplification, so untrusted feeds are safe here.
     try:
-        return ElementTree.fromstring(xml_content)
+        yield from ElementTree.iterparse(xml_content, events=("start", "end"))
     except ElementTree.ParseError as exc:
         raise ContentDiscoveryError("Response body is not valid XML.") from exc
 
 
-def _parse_atom_root(root: ElementTree.Element) -> list[FeedEntry]:
+def _read_root(
+    events: Iterator[tuple[str, ElementTree.Element]],
+) -> ElementTree.Element:
+    # The first event is always the start of the document element.
+    for _, root in events:
+        return root
+    raise ContentDiscoveryError("Response body is not valid XML.")
+
+
+def _iter_atom_entries(
+    root: ElementTree.Element, events: Iterator[tuple[str, ElementTree.Element]]
+) -> Iterator[FeedEntry]:
     if _local_name(root.tag) != "feed":
         raise ContentDiscoveryError(
             "Unsupported content type: expected an Atom <feed> document."
@@ -149,133 +282,168 @@ def _parse_atom_root(root: ElementTree.Element) -> list[FeedEntry]:
                 "Unsupported XML namespace. Only Atom feeds are supported currently."
             )
 
-    entries: list[FeedEntry] = []
-    for entry_node in root.findall(_qualified_name("entry", namespace)):
-        url = _entry_link(entry_node, namespace)
-        title = _find_text(entry_node, "title", namespace)
-        summary = _find_text(entry_node, "summary", namespace)
+    tags = ATOM_TAGS[namespace]
+    entry_tag = tags["entry"]
+    link_tag = tags["link"]
+    title_tag = tags["title"]
+    summary_tag = tags["summary"]
+    content_tag = tags["content"]
+    published_tag = tags["published"]
+    updated_tag = tags["updated"]
+    author_tag = tags["author"]
+    name_tag = tags["name"]
+    id_tag = tags["id"]
+
+    depth = 1
+    for event, entry_node in events:
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth != 1 or entry_node.tag != entry_tag:
+            continue
+
+        url = canonical_url(_entry_link(entry_node, link_tag))
+        title = _find_text(entry_node, title_tag)
+        summary = _find_text(entry_node, summary_tag)
         if not summary:
-            summary = _find_text(entry_node, "content", namespace)
+            summary = _find_text(entry_node, content_tag)
 
-        published_raw = _find_text(entry_node, "published", namespace)
-        updated_raw = _find_text(entry_node, "updated", namespace)
+        published_raw = _find_text(entry_node, published_tag)
+        updated_raw = _find_text(entry_node, updated_tag)
         if not updated_raw:
             updated_raw = published_raw
-        created_at = _parse_timestamp(published_raw or updated_raw)
-        updated_at = _parse_timestamp(updated_raw or published_raw)
-
-        author_names: list[str] = []
-        for author_node in entry_node.findall(_qualified_name("author", namespace)):
-            author_name = _find_text(author_node, "name", namespace)
-            if author_name:
-                author_names.append(author_name)
-
-        entries.append(
-            FeedEntry(
-                format="atom",
-                url=url,
-                title=title,
-                summary=summary,
-                created_at=created_at,
-                updated_at=updated_at,
-                entry_id=_find_text(entry_node, "id", namespace) or url,
-                author_names=author_names,
-                published_raw=published_raw,
-                updated_raw=updated_raw,
-            )
+        created_at, updated_at = _parse_timestamp_pair(published_raw, updated_raw)
+
+        author_names = [
+            author_name
+            for author_node in entry_node.iterfind(author_tag)
+            if (author_name := _find_text(author_node, name_tag))
+        ]
+
+        entry = FeedEntry(
+            format="atom",
+            url=url,
+            title=title,
+            summary=summary,
+            created_at=created_at,
+            updated_at=updated_at,
+            entry_id=_find_text(entry_node, id_tag) or url,
+            author_names=author_names,
+            published_raw=published_raw,
+            updated_raw=updated_raw,
         )
-
-    return entries
+        # Drop parsed entries so memory stays flat regardless of feed size.
+        entry_node.clear()
+        root.clear()
+        yield entry
 
 
-def _parse_rss_root(root: ElementTree.Element) -> list[FeedEntry]:
+def _iter_rss_entries(
+    root: ElementTree.Element, events: Iterator[tuple[str, ElementTree.Element]]
+) -> Iterator[FeedEntry]:
     if _local_name(root.tag) != "rss":
         raise ContentDiscoveryError(
             "Unsupported content type: expected an RSS <rss> document."
         )
 
-    channel_node = next(
-        (child for child in list(root) if _local_name(child.tag) == "channel"),
-        None,
-    )
-    if channel_node is None:
-        raise ContentDiscoveryError(
-            "Unsupported RSS document: missing required <channel> element."
-        )
+    channel_node: ElementTree.Element | None = None
+    in_channel = False
+    depth = 1
+    for event, node in events:
+        if event == "start":
+            if (
+                depth == 1
+                and channel_node is None
+                and _local_name(node.tag) == "channel"
+            ):
+                channel_node = node
+                in_channel = True
+            depth += 1
+            continue
 
-    entries: list[FeedEntry] = []
-    for item_node in list(channel_node):
-        if _local_name(item_node.tag) != "item":
+        depth -= 1
+        if node is channel_node:
+            in_channel = False
+        if not in_channel or depth != 2 or _local_name(node.tag) != "item":
             continue
 
-        url = _find_text_local_name(item_node, "link")
-        title = _find_text_local_name(item_node, "title")
-        summary = _find_text_local_name(
-            item_node,
-            "description",
-            "summary",
-            "content",
-            "encoded",
-        )
-        published_raw = _find_text_local_name(
-            item_node,
-            "pubDate",
-            "published",
-            "created",
-            "date",
+        values, author_names = _rss_item_values(node)
+        url = canonical_url(values.get("url", ""))
+        published_raw = values.get("published_raw", "")
+        updated_raw = values.get("updated_raw", "") or published_raw
+        created_at, updated_at = _parse_timestamp_pair(published_raw, updated_raw)
+
+        entry = FeedEntry(
+            format="rss",
+            url=url,
+            title=values.get("title", ""),
+            summary=values.get("summary", ""),
+            created_at=created_at,
+            updated_at=updated_at,
+            entry_id=values.get("entry_id", "") or url,
+            author_names=author_names,
+            published_raw=published_raw,
+            updated_raw=updated_raw,
         )
-        updated_raw = _find_text_local_name(
-            item_node,
-            "updated",
-            "modified",
-        )
-        if not updated_raw:
-            updated_raw = published_raw
+        node.clear()
+        channel_node.clear()
+        yield entry
 
-        entries.append(
-            FeedEntry(
-                format="rss",
-                url=url,
-                title=title,
-                summary=summary,
-                created_at=_parse_timestamp(published_raw or updated_raw),
-                updated_at=_parse_timestamp(updated_raw or published_raw),
-                entry_id=_find_text_local_name(item_node, "guid", "id") or url,
-                author_names=_find_all_text_local_name(item_node, "author", "creator"),
-                published_raw=published_raw,
-                updated_raw=updated_raw,
-            )
+    if channel_node is None:
+        raise ContentDiscoveryError(
+            "Unsupported RSS document: missing required <channel> element."
         )
 
-    return entries
-
 
-def parse_atom_feed(xml_content: str | bytes) -> list[FeedEntry]:
-    return _parse_atom_root(_parse_xml_root(xml_content))
+def iter_atom_feed(xml_content: str | bytes | IO[bytes]) -> Iterator[FeedEntry]:
+    events = _iter_xml_events(xml_content)
+    return _iter_atom_entries(_read_root(events), events)
 
 
-def parse_rss_feed(xml_content: str | bytes) -> list[FeedEntry]:
-    return _parse_rss_root(_parse_xml_root(xml_content))
+def iter_rss_feed(xml_content: str | bytes | IO[bytes]) -> Iterator[FeedEntry]:
+    events = _iter_xml_events(xml_content)
+    return _iter_rss_entries(_read_root(events), events)
 
 
-def parse_feed(xml_content: str | bytes) -> list[FeedEntry]:
-    root = _parse_xml_root(xml_content)
+def iter_feed(xml_content: str | bytes | IO[bytes]) -> Iterator[FeedEntry]:
+    events = _iter_xml_events(xml_content)
+    root = _read_root(events)
     root_name = _local_name(root.tag)
     if root_name == "feed":
-        return _parse_atom_root(root)
+        return _iter_atom_entries(root, events)
     if root_name == "rss":
-        return _parse_rss_root(root)
+        return _iter_rss_entries(root, events)
 
     raise ContentDiscoveryError(
         "Unsupported content type: expected an Atom <feed> or RSS <rss> document."
     )
 
 
+def parse_atom_feed(xml_content: str | bytes | IO[bytes]) -> list[FeedEntry]:
+    return list(iter_atom_feed(xml_content))
+
+
+def parse_rss_feed(xml_content: str | bytes | IO[bytes]) -> list[FeedEntry]:
+    return list(iter_rss_feed(xml_content))
+
+
+def parse_feed(xml_content: str | bytes | IO[bytes]) -> list[FeedEntry]:
+    return list(iter_feed(xml_content))
+
+
 def _is_github_org_api_url(url: str) -> bool:
     return url.strip().lower().startswith(GITHUB_ORG_API_PREFIX)
 
 
 def _parse_json_document(json_content: str | bytes):
+    if orjson is not None:
+        # orjson parses bytes directly, so skip the intermediate str decode.
+        try:
+            return orjson.loads(json_content)
+        except orjson.JSONDecodeError as exc:
+            raise ContentDiscoveryError("Response body is not valid JSON.") from exc
+
     if isinstance(json_content, bytes):
         try:
             json_content = json_content.decode("utf-8")
@@ -297,64 +465,64 @@ def parse_github_org_repositories(json_content: str | bytes) -> list[FeedEntry]:
             "Unsupported GitHub API response: expected a JSON list of repositories."
         )
 
-    entries: list[FeedEntry] = []
-    for repository in document:
-        if not isinstance(repository, dict):
-            continue
+    return [
+        entry for entry in map(_github_repository_entry, document) if entry is not None
+    ]
 
-        html_url = str(repository.get("html_url") or "").strip()
-        if not html_url:
-            continue
 
-        title = str(repository.get("name", html_url)).strip()
-        summary = str(repository.get("description", "")).strip()
-        created_raw = str(repository.get("created_at", "")).strip()
-        updated_raw = str(repository.get("updated_at", "")).strip()
-        pushed_raw = str(repository.get("pushed_at", "")).strip()
-        if not updated_raw:
-            updated_raw = pushed_raw or created_raw
-
-        owner = repository.get("owner")
-        owner_login = ""
-        if isinstance(owner, dict):
-            owner_login = str(owner.get("login", "")).strip()
-
-        raw_topics = repository.get("topics")
-        topics: list[str] = []
-        if isinstance(raw_topics, list):
-            topics = [str(topic).strip() for topic in raw_topics if str(topic).strip()]
-
-        github_metadata = {
-            "watchers": repository.get("watchers", repository.get("watchers_count")),
-            "open_issues": repository.get(
-                "open_issues", repository.get("open_issues_count")
-            ),
-            "language": repository.get("language"),
-            "topics": topics,
-        }
-
-        entry_id = str(
-            repository.get("node_id") or repository.get("id") or html_url
-        ).strip()
-        author_names = [owner_login] if owner_login else []
-
-        entries.append(
-            FeedEntry(
-                format="github_org_repositories",
-                url=html_url,
-                title=title,
-                summary=summary,
-                created_at=_parse_timestamp(created_raw or updated_raw),
-                updated_at=_parse_timestamp(updated_raw or created_raw),
-                entry_id=entry_id,
-                author_names=author_names,
-                published_raw=created_raw,
-                updated_raw=updated_raw,
-                metadata=github_metadata,
-            )
-        )
+def _github_repository_entry(repository: object) -> FeedEntry | None:
+    if not isinstance(repository, dict):
+        return None
+
+    html_url = canonical_url(str(repository.get("html_url") or ""))
+    if not html_url:
+        return None
 
-    return entries
+    title = str(repository.get("name", html_url)).strip()
+    summary = str(repository.get("description", "")).strip()
+    created_raw = str(repository.get("created_at", "")).strip()
+    updated_raw = str(repository.get("updated_at", "")).strip()
+    pushed_raw = str(repository.get("pushed_at", "")).strip()
+    if not updated_raw:
+        updated_raw = pushed_raw or created_raw
+
+    owner = repository.get("owner")
+    owner_login = ""
+    if isinstance(owner, dict):
+        owner_login = str(owner.get("login", "")).strip()
+
+    raw_topics = repository.get("topics")
+    topics: list[str] = []
+    if isinstance(raw_topics, list):
+        topics = [topic for raw in raw_topics if (topic := str(raw).strip())]
+
+    github_metadata = {
+        "watchers": repository.get("watchers", repository.get("watchers_count")),
+        "open_issues": repository.get(
+            "open_issues", repository.get("open_issues_count")
+        ),
+        "language": repository.get("language"),
+        "topics": topics,
+    }
+
+    entry_id = str(
+        repository.get("node_id") or repository.get("id") or html_url
+    ).strip()
+    created_at, updated_at = _parse_timestamp_pair(created_raw, updated_raw)
+
+    return FeedEntry(
+        format="github_org_repositories",
+        url=html_url,
+        title=title,
+        summary=summary,
+        created_at=created_at,
+        updated_at=updated_at,
+        entry_id=entry_id,
+        author_names=[owner_login] if owner_login else [],
+        published_raw=created_raw,
+        updated_raw=updated_raw,
+        metadata=github_metadata,
+    )
 
 
 def fetch_source_content(
@@ -363,115 +531,297 @@ def fetch_source_content(
     timeout: float = 15.0,
     disable_tls_verification: bool = False,
     accept_header: str | None = None,
-) -> bytes:
+    etag: str = "",
+    last_modified: str = "",
+) -> FetchedSourceContent:
     if not accept_header:
         accept_header = (
             "application/atom+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.1"
         )
 
-    request = Request(
-        url,
-        headers={
-            "User-Agent": USER_AGENT,
-            "Accept": accept_header,
-        },
-    )
-
-    request_kwargs = {"timeout": timeout}
-    if disable_tls_verification:
-        request_kwargs["context"] = ssl._create_unverified_context()
+    headers = {"Accept": accept_header}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
 
     try:
-        with urlopen(request, **request_kwargs) as response:
-            body = response.read()
-    except (HTTPError, URLError, OSError) as exc:
+        response = HTTP_SESSION.get(
+            url,
+            headers=headers,
+            timeout=timeout,
+            verify=not disable_tls_verification,
+        )
+        response.raise_for_status()
+        body = response.content
+    except requests.RequestException as exc:
         raise ContentDiscoveryError(f"Could not fetch '{url}': {exc}") from exc
 
+    if response.status_code == HTTPStatus.NOT_MODIFIED:
+        return FetchedSourceContent(
+            body=b"",
+            etag=response.headers.get("ETag") or etag,
+            last_modified=response.headers.get("Last-Modified") or last_modified,
+            not_modified=True,
+        )
+
     if not body:
         raise ContentDiscoveryError(
             f"Remote source '{url}' returned an empty response."
         )
-    return body
+    return FetchedSourceContent(
+        body=body,
+        etag=response.headers.get("ETag", ""),
+        last_modified=response.headers.get("Last-Modified", ""),
+    )
 
 
 def sync_content_discovery_source(
-    source: ContentDiscoverySource, *, timeout: float = 15.0
+    source: ContentDiscoverySource, *, timeout: float = 15.0, force: bool = False
 ) -> SourceSyncResult:
+    """
+    Fetch a source and upsert its entries.
+
+    Unless ``force`` is set, the stored validators are sent so an unchanged
+    source answers with 304 and nothing is imported. Manual syncs force a full
+    fetch so they can restore items removed since the last sync.
+    """
     is_github_org_source = _is_github_org_api_url(source.url)
     accept_header = (
         "application/vnd.github+json, application/json;q=0.9, */*;q=0.1"
         if is_github_org_source
         else None
     )
-    feed_body = fetch_source_content(
+    fetched = fetch_source_content(
         source.url,
         timeout=timeout,
         disable_tls_verification=source.disable_tls_verification,
         accept_header=accept_header,
+        etag="" if force else source.etag,
+        last_modified="" if force else source.last_modified,
     )
-    if is_github_org_source:
-        entries = parse_github_org_repositories(feed_body)
-    else:
-        entries = parse_feed(feed_body)
 
     result = SourceSyncResult(
         source_id=source.pk or 0,
         source_label=str(source),
         source_url=source.url,
     )
-    existing_urls = set(
-        ExternalContentItem.objects.filter(
-            url__in=[entry.url for entry in entries]
-        ).values_list("url", flat=True)
+    if fetched.not_modified:
+        result.not_modified = True
+        _save_cache_validators(source, fetched)
+        return result
+
+    if is_github_org_source:
+        entries = parse_github_org_repositories(fetched.body)
+    else:
+        entries = parse_feed(fetched.body)
+
+    existing_search_text = _existing_item_values_by_url(
+        {entry.url for entry in entries}, *SEARCH_TEXT_FIELDS
     )
+    existing_urls = set(existing_search_text)
     seen_urls: set[str] = set()
+    changed_urls: list[str] = []
+    items_to_upsert: list[ExternalContentItem] = []
 
     for entry in entries:
         result.total_entries += 1
-        entry_url = entry.url.strip()
+        entry_url = entry.url
         if not entry_url or entry_url in seen_urls:
             result.skipped += 1
             continue
         seen_urls.add(entry_url)
 
-        metadata = {
-            "format": entry.format,
-            "entry_id": entry.entry_id,
-            "author_names": entry.author_names,
-            "published_raw": entry.published_raw,
-            "updated_raw": entry.updated_raw,
-        }
-        metadata.update(entry.metadata)
-        metadata = {
-            key: value
-            for key, value in metadata.items()
-            if value not in (None, "", [], {})
-        }
-
-        ExternalContentItem.upsert_from_url(
-            url=entry_url,
-            source=source,
-            title=entry.title,
-            summary=entry.summary,
-            published_at=entry.created_at,
-            created_at=entry.created_at,
-            updated_at=entry.updated_at,
-            metadata=metadata,
+        metadata = {}
+        if entry.format:
+            metadata["format"] = entry.format
+        if entry.entry_id:
+            metadata["entry_id"] = entry.entry_id
+        if entry.author_names:
+            metadata["author_names"] = entry.author_names
+        if entry.published_raw:
+            metadata["published_raw"] = entry.published_raw
+        if entry.updated_raw:
+            metadata["updated_raw"] = entry.updated_raw
+        for key, value in entry.metadata.items():
+            if value in EMPTY_METADATA_VALUES:
+                metadata.pop(key, None)
+            else:
+                metadata[key] = value
+
+        items_to_upsert.append(
+            ExternalContentItem(
+                key=ExternalContentItem.build_key(entry_url),
+                url=entry_url,
+                source=source,
+                title=entry.title,
+                summary=entry.summary,
+                published_at=entry.created_at,
+                created_at=entry.created_at,
+                updated_at=entry.updated_at,
+                metadata=metadata,
+            )
         )
 
+        # Only new items and items whose searched text changed need their
+        # stored search vector rebuilt.
+        if existing_search_text.get(entry_url) != (
+            entry_url,
+            entry.title,
+            entry.summary,
+            source.pk,
+        ):
+            changed_urls.append(entry_url)
+
         if entry_url in existing_urls:
             result.updated += 1
         else:
             existing_urls.add(entry_url)
             result.created += 1
 
+    if items_to_upsert:
+        with transaction.atomic():
+            ExternalContentItem.objects.bulk_create(
+                items_to_upsert,
+                batch_size=UPSERT_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["key"],
+                update_fields=UPSERT_UPDATE_FIELDS,
+            )
+            # Bulk upserts skip save(), so rebuild the stored search vectors of
+            # items that were inserted, changed or newly tagged, once each.
+            source_tags = source.get_default_tags()
+            if source_tags:
+                item_ids_by_url = _existing_item_ids_by_url(seen_urls)
+                refreshed_item_ids = ExternalContentItem.add_tags_to_items(
+                    list(item_ids_by_url.values()), source_tags, refresh_vectors=False
+                )
+                refreshed_item_ids.update(item_ids_by_url[url] for url in changed_urls)
+                refreshed_items = (
+                    ExternalContentItem.objects.filter(pk__in=item_id_batch)
+                    for item_id_batch in batched(
+                        sorted(refreshed_item_ids), UPSERT_BATCH_SIZE
+                    )
+                )
+            else:
+                refreshed_items = (
+                    ExternalContentItem.objects.filter(
+                        key__in=[
+                            ExternalContentItem.build_key(url) for url in url_batch
+                        ]
+                    )
+                    for url_batch in batched(changed_urls, UPSERT_BATCH_SIZE)
+                )
+            for items in refreshed_items:
+                ExternalContentItem.update_search_vectors(items)
+            # Bulk upserts bypass the post_save signal that normally retires
+            # cached search results.
+            transaction.on_commit(invalidate_search_cache)
+
+    # Only remember validators once the content has been stored, so a failed
+    # sync is retried with a full fetch.
+    _save_cache_validators(source, fetched)
     return result
 
 
+def _existing_item_ids_by_url(urls: Iterable[str]) -> dict[str, int]:
+    return {url: pk for url, (pk,) in _existing_item_values_by_url(urls, "pk").items()}
+
+
+def _existing_item_values_by_url(
+    urls: Iterable[str], *field_names: str
+) -> dict[str, tuple]:
+    # Look URLs up by their hashed key, which carries the unique index, in
+    # bounded batches so large feeds stay under database parameter limits.
+    values_by_url: dict[str, tuple] = {}
+    for url_batch in batched(filter(None, urls), URL_LOOKUP_BATCH_SIZE):
+        urls_by_key = {ExternalContentItem.build_key(url): url for url in url_batch}
+        for key, *values in ExternalContentItem.objects.filter(
+            key__in=urls_by_key
+        ).values_list("key", *field_names):
+            values_by_url[urls_by_key[bytes(key)]] = tuple(values)
+    return values_by_url
+
+
+def _save_cache_validators(
+    source: ContentDiscoverySource, fetched: FetchedSourceContent
+) -> None:
+    if source.pk is None:
+        return
+
+    # Oversized validators cannot be stored intact, so skip them rather than
+    # sending a truncated value back to the server.
+    validators = {}
+    for field_name in ("etag", "last_modified"):
+        value = getattr(fetched, field_name)
+        max_length = source._meta.get_field(field_name).max_length
+        validators[field_name] = value if len(value) <= max_length else ""
+
+    changed_fields = [
+        field_name
+        for field_name, value in validators.items()
+        if getattr(source, field_name) != value
+    ]
+    if not changed_fields:
+        return
+
+    for field_name in changed_fields:
+        setattr(source, field_name, validators[field_name])
+    source.save(update_fields=changed_fields)
+
+
+def _sync_content_discovery_source_in_thread(
+    source: ContentDiscoverySource, timeout: float
+) -> SourceSyncResult:
+    # Django connections are per-thread; release this worker's connection
+    # so pooled threads do not leave idle database sessions behind.
+    close_old_connections()
+    try:
+        return sync_content_discovery_source(source, timeout=timeout)
+    finally:
+        connections.close_all()
+
+
+def iter_content_discovery_source_syncs(
+    sources: Iterable[ContentDiscoverySource],
+    *,
+    timeout: float = 15.0,
+    max_workers: int = SYNC_MAX_WORKERS,
+) -> Iterator[
+    tuple[ContentDiscoverySource, SourceSyncResult | None, ContentDiscoveryError | None]
+]:
+    """
+    Sync sources concurrently, yielding ``(source, result, error)`` per source.
+
+    Results are yielded in the order the sources were given. A source that
+    fails with ``ContentDiscoveryError`` is yielded with that error instead of
+    a result, so one failing feed does not stop the others.
+    """
+    sources = list(sources)
+    if not sources:
+        return
+
+    # Fetching is network-bound, so overlap the request latency across sources.
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as executor:
+        futures = [
+            executor.submit(_sync_content_discovery_source_in_thread, source, timeout)
+            for source in sources
+        ]
+        for source, future in zip(sources, futures):
+            try:
+                yield source, future.result(), None
+            except ContentDiscoveryError as exc:
+                yield source, None, exc
+
+
 def sync_content_discovery_sources(
     sources: Iterable[ContentDiscoverySource], *, timeout: float = 15.0
 ) -> list[SourceSyncResult]:
-    return [
-        sync_content_discovery_source(source=source, timeout=timeout)
-        for source in sources
-    ]
+    results: list[SourceSyncResult] = []
+    for _source, result, exc in iter_content_discovery_source_syncs(
+        sources, timeout=timeout
+    ):
+        if exc is not None:
+            raise exc
+        results.append(result)
+    return results
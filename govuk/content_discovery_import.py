@@ -3,16 +3,29 @@ from __future__ import annotations
 import csv
 
 from dataclasses import dataclass
-from typing import TextIO
+from typing import Iterable, TextIO
 
 from django.db import transaction
-from django.db.models import Max
 from wagtail.models import Site
 
-from govuk.models import ContentDiscoverySettings, ContentDiscoverySource, GovukTag
+from govuk.models import (
+    SOURCE_FETCH_FIELDS,
+    ContentDiscoverySettings,
+    ContentDiscoverySource,
+    ExternalContentItem,
+    GovukTag,
+)
+from govuk.search_backend import invalidate_search_cache
 
 TRUTHY_VALUES = {"1", "true", "t", "yes", "y", "on"}
 FALSY_VALUES = {"0", "false", "f", "no", "n", "off", ""}
+IMPORT_BATCH_SIZE = 1000
+IMPORT_COLUMNS = frozenset(
+    {"url", "site_id", "name", "disable_tls_verification", "default_tags"}
+)
+# Settings are loaded by the importer itself, so re-checking that the foreign
+# key exists would cost a query per row.
+SOURCE_CLEAN_EXCLUDE = ["settings"]
 
 
 class ContentDiscoverySourceImportError(ValueError):
@@ -42,58 +55,85 @@ def import_content_discovery_sources_from_csv(
             "--site-id must be a positive integer."
         )
 
-    reader = csv.DictReader(csv_file, delimiter=delimiter)
-    if not reader.fieldnames:
+    reader = csv.reader(csv_file, delimiter=delimiter)
+    headers = next(reader, None)
+    if not headers:
         raise ContentDiscoverySourceImportError("CSV file is missing a header row.")
 
-    header_names = {
-        (header or "").strip().lower()
-        for header in reader.fieldnames
-        if (header or "").strip()
-    }
-    if "url" not in header_names:
+    # Only the known columns are read from each row; a repeated header uses
+    # its last column.
+    column_indexes = {}
+    for index, header in enumerate(headers):
+        header_name = header.strip().lower()
+        if header_name in IMPORT_COLUMNS:
+            column_indexes[header_name] = index
+    header_count = len(headers)
+
+    if "url" not in column_indexes:
         raise ContentDiscoverySourceImportError("CSV header must include a 'url' column.")
-    if "site_id" not in header_names and default_site_id is None:
+    if "site_id" not in column_indexes and default_site_id is None:
         raise ContentDiscoverySourceImportError(
             "Provide a 'site_id' column or pass --site-id for all rows."
         )
 
-    has_name = "name" in header_names
-    has_tls = "disable_tls_verification" in header_names
-    has_default_tags = "default_tags" in header_names
-    settings_cache: dict[int, ContentDiscoverySettings] = {}
+    has_name = "name" in column_indexes
+    has_tls = "disable_tls_verification" in column_indexes
+    has_default_tags = "default_tags" in column_indexes
     result = ContentDiscoverySourceImportResult()
 
-    with transaction.atomic():
-        for row_index, raw_row in enumerate(reader, start=2):
-            row = _normalize_row(raw_row)
-            if not any(value for value in row.values()):
-                result.skipped_empty += 1
-                continue
-
-            result.processed += 1
-            site_id = _resolve_site_id(
-                row=row,
-                row_index=row_index,
-                default_site_id=default_site_id,
-                allowed_site_ids=allowed_site_ids,
-            )
-            source_settings = _get_settings_for_site(
-                site_id=site_id,
-                row_index=row_index,
-                cache=settings_cache,
+    # Read and validate every row up front so sites and existing sources can
+    # be loaded in bulk rather than queried row by row.
+    rows: list[tuple[int, dict[str, str], int]] = []
+    tag_keys: set[str] = set()
+    # Blank lines are skipped without counting as rows, as csv.DictReader did.
+    for row_index, values in enumerate(filter(None, reader), start=2):
+        value_count = len(values)
+        row = {
+            name: values[index].strip() if index < value_count else ""
+            for name, index in column_indexes.items()
+        }
+        # Known columns are stripped once above; the remaining cells only need
+        # checking when all of those are blank.
+        if not any(row.values()) and not any(
+            value.strip() for value in values[:header_count]
+        ):
+            result.skipped_empty += 1
+            continue
+        site_id = _resolve_site_id(
+            row=row,
+            row_index=row_index,
+            default_site_id=default_site_id,
+            allowed_site_ids=allowed_site_ids,
+        )
+        if not row.get("url", ""):
+            raise ContentDiscoverySourceImportError(
+                f"Row {row_index}: 'url' cannot be blank."
             )
+        rows.append((row_index, row, site_id))
+        if has_default_tags:
+            tag_keys.update(_split_tag_keys(row.get("default_tags", "")))
+
+    tag_ids_by_key = (
+        dict(GovukTag.objects.filter(slug__in=tag_keys).values_list("slug", "pk"))
+        if tag_keys
+        else {}
+    )
 
-            url = row.get("url", "")
-            if not url:
-                raise ContentDiscoverySourceImportError(
-                    f"Row {row_index}: 'url' cannot be blank."
-                )
+    with transaction.atomic():
+        settings_by_site_id = _get_settings_for_sites(rows)
+        existing_sources, next_sort_orders = _get_existing_sources(
+            settings_by_site_id.values()
+        )
 
-            source = ContentDiscoverySource.objects.filter(
-                settings=source_settings,
-                url=url,
-            ).first()
+        # Writes are collected and flushed in bulk once every row is valid.
+        new_sources: list[ContentDiscoverySource] = []
+        updated_fields_by_source: dict[ContentDiscoverySource, set[str]] = {}
+
+        for row_index, row, site_id in rows:
+            result.processed += 1
+            source_settings = settings_by_site_id[site_id]
+            url = row["url"]
+            source = existing_sources.get((source_settings.pk, url))
 
             name = row.get("name", "") if has_name else None
             disable_tls_verification = (
@@ -109,15 +149,17 @@ def import_content_discovery_sources_from_csv(
                 _parse_default_tag_stream(
                     row.get("default_tags", ""),
                     row_index=row_index,
+                    tag_ids_by_key=tag_ids_by_key,
                 )
                 if has_default_tags
                 else None
             )
 
             if source is None:
+                sort_order = next_sort_orders.get(source_settings.pk, 0)
                 source = ContentDiscoverySource(
                     settings=source_settings,
-                    sort_order=_next_sort_order(source_settings),
+                    sort_order=sort_order,
                     url=url,
                     name=name or "",
                     disable_tls_verification=(
@@ -127,8 +169,12 @@ def import_content_discovery_sources_from_csv(
                     ),
                     default_tags=default_tag_stream or [],
                 )
-                source.full_clean()
-                source.save()
+                # Existence was checked against the loaded sources and the only
+                # unique field is the primary key, so field validation suffices.
+                source.clean_fields(exclude=SOURCE_CLEAN_EXCLUDE)
+                new_sources.append(source)
+                next_sort_orders[source_settings.pk] = sort_order + 1
+                existing_sources[(source_settings.pk, url)] = source
                 result.created += 1
                 continue
 
@@ -146,27 +192,61 @@ def import_content_discovery_sources_from_csv(
             if (
                 has_default_tags
                 and default_tag_stream is not None
-                and source.get_default_tag_ids() != _tag_ids_from_stream(default_tag_stream)
+                and source.get_raw_default_tag_ids()
+                != _tag_ids_from_stream(default_tag_stream)
             ):
                 source.default_tags = default_tag_stream
                 fields_to_update.append("default_tags")
 
+            if SOURCE_FETCH_FIELDS.intersection(fields_to_update) and (
+                source.etag or source.last_modified
+            ):
+                # bulk_update() skips save(), so forget the validators here.
+                source.clear_cache_validators()
+                fields_to_update.extend(["etag", "last_modified"])
+
             if fields_to_update:
-                source.full_clean(validate_unique=False)
-                source.save(update_fields=fields_to_update)
+                source.clean_fields(
+                    exclude=[
+                        field.name
+                        for field in source._meta.concrete_fields
+                        if field.name not in fields_to_update
+                    ]
+                )
+                # Sources created earlier in this file are inserted with their
+                # final values, so only existing rows need an UPDATE.
+                if source.pk is not None:
+                    updated_fields_by_source.setdefault(source, set()).update(
+                        fields_to_update
+                    )
                 result.updated += 1
             else:
                 result.unchanged += 1
 
-    return result
-
+        ContentDiscoverySource.objects.bulk_create(
+            new_sources, batch_size=IMPORT_BATCH_SIZE
+        )
+        sources_by_fields: dict[tuple[str, ...], list[ContentDiscoverySource]] = {}
+        for source, fields in updated_fields_by_source.items():
+            sources_by_fields.setdefault(tuple(sorted(fields)), []).append(source)
+        for fields, sources in sources_by_fields.items():
+            ContentDiscoverySource.objects.bulk_update(
+                sources, fields, batch_size=IMPORT_BATCH_SIZE
+            )
+        # bulk_update() sends no post_save, so refresh the search vectors of
+        # items whose source name changed here and retire cached results.
+        renamed_sources = [
+            source
+            for source, fields in updated_fields_by_source.items()
+            if "name" in fields
+        ]
+        if renamed_sources:
+            ExternalContentItem.update_search_vectors(
+                ExternalContentItem.objects.filter(source__in=renamed_sources)
+            )
+            transaction.on_commit(invalidate_search_cache)
 
-def _normalize_row(raw_row: dict[str, str | None]) -> dict[str, str]:
-    return {
-        (key or "").strip().lower(): (value or "").strip()
-        for key, value in raw_row.items()
-        if key is not None
-    }
+    return result
 
 
 def _resolve_site_id(
@@ -217,54 +297,52 @@ def _tag_ids_from_stream(stream_data: list[dict[str, int]]) -> list[int]:
     return [int(block["value"]) for block in stream_data]
 
 
+def _split_tag_keys(raw_value: str) -> list[str]:
+    keys = (key.strip().lower() for key in raw_value.split("|"))
+    return list(dict.fromkeys(key for key in keys if key))
+
+
 def _parse_default_tag_stream(
     raw_value: str,
     *,
     row_index: int,
+    tag_ids_by_key: dict[str, int],
 ) -> list[dict[str, int]]:
-    tag_keys = [key.strip().lower() for key in raw_value.split("|") if key.strip()]
-    if not tag_keys:
-        return []
-
-    seen: set[str] = set()
-    ordered_keys: list[str] = []
-    for key in tag_keys:
-        if key in seen:
-            continue
-        seen.add(key)
-        ordered_keys.append(key)
-
-    tags_by_key = {tag.slug: tag for tag in GovukTag.objects.filter(slug__in=ordered_keys)}
-    missing = [key for key in ordered_keys if key not in tags_by_key]
+    ordered_keys = _split_tag_keys(raw_value)
+    missing = [key for key in ordered_keys if key not in tag_ids_by_key]
     if missing:
         raise ContentDiscoverySourceImportError(
             f"Row {row_index}: unknown tag key(s): {', '.join(missing)}."
         )
 
-    return [{"type": "tag", "value": tags_by_key[key].pk} for key in ordered_keys]
+    return [{"type": "tag", "value": tag_ids_by_key[key]} for key in ordered_keys]
 
 
-def _get_settings_for_site(
-    *,
-    site_id: int,
-    row_index: int,
-    cache: dict[int, ContentDiscoverySettings],
-) -> ContentDiscoverySettings:
-    if site_id in cache:
-        return cache[site_id]
-
-    site = Site.objects.filter(pk=site_id).first()
-    if site is None:
-        raise ContentDiscoverySourceImportError(
-            f"Row {row_index}: site_id {site_id} does not exist."
-        )
+def _get_settings_for_sites(
+    rows: list[tuple[int, dict[str, str], int]],
+) -> dict[int, ContentDiscoverySettings]:
+    sites = Site.objects.in_bulk({site_id for _, _, site_id in rows})
+    for row_index, _, site_id in rows:
+        if site_id not in sites:
+            raise ContentDiscoverySourceImportError(
+                f"Row {row_index}: site_id {site_id} does not exist."
+            )
 
-    cache[site_id] = ContentDiscoverySettings.for_site(site)
-    return cache[site_id]
+    return {
+        site_id: ContentDiscoverySettings.for_site(site)
+        for site_id, site in sites.items()
+    }
 
 
-def _next_sort_order(settings: ContentDiscoverySettings) -> int:
-    current_max = settings.sources.aggregate(max_sort_order=Max("sort_order"))[
-        "max_sort_order"
-    ]
-    return (current_max if current_max is not None else -1) + 1
+def _get_existing_sources(
+    settings: Iterable[ContentDiscoverySettings],
+) -> tuple[dict[tuple[int, str], ContentDiscoverySource], dict[int, int]]:
+    sources: dict[tuple[int, str], ContentDiscoverySource] = {}
+    next_sort_orders: dict[int, int] = {}
+    # Sources are ordered by sort_order, so the first match per URL wins.
+    for source in ContentDiscoverySource.objects.filter(settings__in=list(settings)):
+        sources.setdefault((source.settings_id, source.url), source)
+        next_sort_orders[source.settings_id] = max(
+            next_sort_orders.get(source.settings_id, 0), source.sort_order + 1
+        )
+    return sources, next_sort_orders
@@ -1,57 +1,149 @@
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
 from django.http import Http404
 from wagtail.models import Page, Site
 
 from govuk.models import FooterSettings, PhaseBannerSettings
 
+NAVIGATION_CACHE_TIMEOUT = 300
+NAVIGATION_CACHE_VERSION_KEY = "govuk:navigation:version"
+# Menus and breadcrumbs only need titles and URLs, which the base Page
+# provides, so avoid loading specific page subclasses.
+NAVIGATION_PAGE_FIELDS = ("id", "path", "depth", "title", "url_path", "locale_id")
+# Paths served by the admin or file storage never resolve to a Wagtail page, so
+# navigation lookups for them are skipped entirely.
+NON_PAGE_PATH_PREFIXES = ("/admin/", "/django-admin/")
+
+EMPTY_NAVIGATION_CONTEXT = {
+    "service_navigation_items": [],
+    "breadcrumbs": [],
+    "phase_banner_settings": None,
+    "footer_settings": None,
+}
+
+
+def invalidate_navigation_cache(**kwargs):
+    """
+    Retire every cached navigation menu and breadcrumb trail.
+
+    Entries are keyed by a shared version token, so replacing the token
+    invalidates them all without having to know which keys exist.
+    """
+    cache.set(NAVIGATION_CACHE_VERSION_KEY, uuid4().hex, None)
+
+
+def invalidate_navigation_cache_for_page(sender, instance, **kwargs):
+    if isinstance(instance, Page):
+        invalidate_navigation_cache()
+
+
+def _navigation_cache_version():
+    version = cache.get(NAVIGATION_CACHE_VERSION_KEY)
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(NAVIGATION_CACHE_VERSION_KEY, version, None):
+            version = cache.get(NAVIGATION_CACHE_VERSION_KEY, version)
+    return version
+
+
+def _build_menu_items(request, site_root):
+    menu_pages = (
+        site_root.get_children()
+        .live()
+        .in_menu()
+        .order_by("path")
+        .only(*NAVIGATION_PAGE_FIELDS)
+    )
+    return [
+        {
+            "title": menu_page.title,
+            "url": menu_page.get_url(request),
+            "path": menu_page.path,
+        }
+        for menu_page in menu_pages
+    ]
+
+
+def _build_breadcrumb_trail(request, site_root, current_page):
+    trail = []
+    ancestors = (
+        current_page.get_ancestors(inclusive=True)
+        .filter(path__startswith=site_root.path)
+        .only(*NAVIGATION_PAGE_FIELDS)
+    )
+    for ancestor in ancestors:
+        is_current = ancestor.pk == current_page.pk
+        trail.append(
+            {
+                "title": ancestor.title,
+                "url": None if is_current else ancestor.get_url(request),
+                "is_current": is_current,
+            }
+        )
+    return trail
+
+
+def _is_non_page_path(path):
+    prefixes = NON_PAGE_PATH_PREFIXES + tuple(
+        url for url in (settings.STATIC_URL, settings.MEDIA_URL) if url
+    )
+    return path.startswith(prefixes)
+
 
 def navigation_and_breadcrumbs(request):
+    if _is_non_page_path(request.path_info):
+        return dict(EMPTY_NAVIGATION_CONTEXT)
+
     site = Site.find_for_request(request)
     if site is None:
-        return {
-            "service_navigation_items": [],
-            "breadcrumbs": [],
-            "phase_banner_settings": None,
-            "footer_settings": None,
-        }
+        return dict(EMPTY_NAVIGATION_CONTEXT)
 
-    site_root = site.root_page.specific
+    site_root = site.root_page
 
     try:
         current_page = Page.find_for_request(request, request.path_info)
     except Http404:
         current_page = None
 
-    service_navigation_items = []
-    menu_pages = site_root.get_children().live().in_menu().specific().order_by("path")
-    for menu_page in menu_pages:
-        service_navigation_items.append(
-            {
-                "title": menu_page.title,
-                "url": menu_page.get_url(request),
-                "is_active": bool(
-                    current_page and current_page.path.startswith(menu_page.path)
-                ),
-            }
-        )
-
-    breadcrumbs = []
-    if (
+    has_breadcrumbs = bool(
         current_page
         and current_page.pk != site_root.pk
         and current_page.path.startswith(site_root.path)
-    ):
-        for ancestor in current_page.get_ancestors(inclusive=True).specific():
-            if not ancestor.path.startswith(site_root.path):
-                continue
-
-            is_current = ancestor.pk == current_page.pk
-            breadcrumbs.append(
-                {
-                    "title": ancestor.title,
-                    "url": None if is_current else ancestor.get_url(request),
-                    "is_current": is_current,
-                }
-            )
+    )
+
+    version = _navigation_cache_version()
+    menu_key = f"govuk:navigation:{version}:menu:{site.pk}"
+    breadcrumbs_key = (
+        f"govuk:navigation:{version}:breadcrumbs:{site.pk}:{current_page.pk}"
+        if has_breadcrumbs
+        else None
+    )
+    cached = cache.get_many([key for key in (menu_key, breadcrumbs_key) if key])
+
+    menu_items = cached.get(menu_key)
+    if menu_items is None:
+        menu_items = _build_menu_items(request, site_root)
+        cache.set(menu_key, menu_items, NAVIGATION_CACHE_TIMEOUT)
+
+    breadcrumbs = []
+    if has_breadcrumbs:
+        breadcrumbs = cached.get(breadcrumbs_key)
+        if breadcrumbs is None:
+            breadcrumbs = _build_breadcrumb_trail(request, site_root, current_page)
+            cache.set(breadcrumbs_key, breadcrumbs, NAVIGATION_CACHE_TIMEOUT)
+
+    service_navigation_items = [
+        {
+            "title": item["title"],
+            "url": item["url"],
+            "is_active": bool(
+                current_page and current_page.path.startswith(item["path"])
+            ),
+        }
+        for item in menu_items
+    ]
 
     return {
         "service_navigation_items": service_navigation_items,
@@ -1,6 +1,9 @@
 from django.core.management.base import BaseCommand, CommandError
 
-from govuk.content_discovery import ContentDiscoveryError, sync_content_discovery_source
+from govuk.content_discovery import (
+    SYNC_MAX_WORKERS,
+    iter_content_discovery_source_syncs,
+)
 from govuk.models import ContentDiscoverySource
 
 
@@ -29,8 +32,21 @@ class Command(BaseCommand):
             default=15.0,
             help="HTTP timeout in seconds when fetching each source (default: 15).",
         )
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=SYNC_MAX_WORKERS,
+            help=(
+                "Number of sources to fetch concurrently "
+                f"(default: {SYNC_MAX_WORKERS})."
+            ),
+        )
 
     def handle(self, *args, **options):
+        max_workers = options["max_workers"]
+        if max_workers < 1:
+            raise CommandError("--max-workers must be at least 1.")
+
         sources = ContentDiscoverySource.objects.select_related("settings__site").order_by(
             "id"
         )
@@ -48,18 +64,23 @@ class Command(BaseCommand):
         totals = {"entries": 0, "created": 0, "updated": 0, "skipped": 0}
         failures: list[str] = []
 
-        for source in source_list:
+        # Sources are fetched concurrently; output is still reported in order.
+        for source, result, exc in iter_content_discovery_source_syncs(
+            source_list, timeout=timeout, max_workers=max_workers
+        ):
             source_label = source.name or source.url
             self.stdout.write(f"Syncing source {source.id}: {source_label}")
-            try:
-                result = sync_content_discovery_source(source, timeout=timeout)
-            except ContentDiscoveryError as exc:
+            if exc is not None:
                 failures.append(f"{source.id} ({source_label}): {exc}")
                 self.stderr.write(
                     self.style.ERROR(f"  Failed source {source.id}: {exc}")
                 )
                 continue
 
+            if result.not_modified:
+                self.stdout.write(self.style.SUCCESS("  Not modified since last sync"))
+                continue
+
             totals["entries"] += result.total_entries
             totals["created"] += result.created
             totals["updated"] += result.updated
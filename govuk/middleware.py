@@ -1,11 +1,26 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from django.shortcuts import redirect
 from django.utils.http import url_has_allowed_host_and_scheme
 from wagtail.models import Site
 
 from govuk.oidc import ADMIN_OIDC_NEXT_URL_KEY, build_oidc_login_url
-from govuk.models import AuthenticatedRedirectSettings
+from govuk.models import AuthenticatedRedirectRule
+
+ADMIN_PATH_PREFIXES = ("/admin/", "/django-admin/")
+SAFE_METHODS = frozenset({"GET", "HEAD"})
+
+
+@lru_cache(maxsize=2048)
+def _is_safe_redirect(destination_path: str, host: str, require_https: bool) -> bool:
+    # Redirect rules are a small, fixed set per site, so the same checks repeat.
+    return url_has_allowed_host_and_scheme(
+        destination_path,
+        allowed_hosts={host},
+        require_https=require_https,
+    )
 
 
 class AdminOIDCLoginMiddleware:
@@ -13,12 +28,17 @@ class AdminOIDCLoginMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
-        self.admin_prefixes = ("/admin/", "/django-admin/")
 
     def __call__(self, request):
-        if request.path.startswith(self.admin_prefixes) and not request.user.is_authenticated:
+        if (
+            request.path.startswith(ADMIN_PATH_PREFIXES)
+            and not request.user.is_authenticated
+        ):
             next_url = request.get_full_path()
-            request.session[ADMIN_OIDC_NEXT_URL_KEY] = next_url
+            # Assigning marks the session modified, so only write a new value to
+            # avoid re-saving the session on repeated hits to the same URL.
+            if request.session.get(ADMIN_OIDC_NEXT_URL_KEY) != next_url:
+                request.session[ADMIN_OIDC_NEXT_URL_KEY] = next_url
             return redirect(build_oidc_login_url(next_url))
         return self.get_response(request)
 
@@ -28,8 +48,6 @@ class AuthenticatedUserRedirectMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
-        self.safe_methods = {"GET", "HEAD"}
-        self.admin_prefixes = ("/admin/", "/django-admin/")
 
     def __call__(self, request):
         redirect_url = self._get_redirect_url(request)
@@ -38,36 +56,34 @@ class AuthenticatedUserRedirectMiddleware:
         return self.get_response(request)
 
     def _get_redirect_url(self, request) -> str | None:
-        if request.method not in self.safe_methods:
+        # Check the request line before touching request.user, which loads the
+        # session and user on first access.
+        if request.method not in SAFE_METHODS:
             return None
-        if not request.user.is_authenticated:
+        if request.path.startswith(ADMIN_PATH_PREFIXES):
             return None
-        if request.path.startswith(self.admin_prefixes):
+        if not request.user.is_authenticated:
             return None
 
         site = Site.find_for_request(request)
         if site is None:
             return None
 
-        redirect_settings = AuthenticatedRedirectSettings.objects.filter(
-            site=site
-        ).first()
-        if redirect_settings is None:
-            return None
-
-        redirect_rule = redirect_settings.redirect_rules.filter(
-            source_path=request.path
-        ).first()
-        if redirect_rule is None:
+        destination_path = (
+            AuthenticatedRedirectRule.objects.filter(
+                settings__site=site,
+                source_path=request.path,
+            )
+            .values_list("destination_path", flat=True)
+            .first()
+        )
+        if destination_path is None:
             return None
 
-        destination_path = redirect_rule.destination_path
         if destination_path == request.path:
             return None
-        if not url_has_allowed_host_and_scheme(
-            destination_path,
-            allowed_hosts={request.get_host()},
-            require_https=request.is_secure(),
+        if not _is_safe_redirect(
+            destination_path, request.get_host(), request.is_secure()
         ):
             return None
         return destination_path
@@ -32,18 +32,16 @@ def convert_root_page_to_homepage(apps, schema_editor):
         app_label="govuk",
         model="homepage",
     )
-    child_table = HomePage._meta.db_table
-    qn = schema_editor.quote_name
-
-    with schema_editor.connection.cursor() as cursor:
-        cursor.execute(
-            f"SELECT 1 FROM {qn(child_table)} WHERE {qn('page_ptr_id')} = %s",
-            [root_page.id],
-        )
-        row_exists = cursor.fetchone() is not None
-        if not row_exists:
+    row_exists = (
+        HomePage.objects.using(db_alias).filter(page_ptr_id=root_page.id).exists()
+    )
+    if not row_exists:
+        # Insert only the child row; creating a HomePage through the ORM would
+        # also insert a second wagtailcore_page row.
+        qn = schema_editor.quote_name
+        with schema_editor.connection.cursor() as cursor:
             cursor.execute(
-                f"INSERT INTO {qn(child_table)} ({qn('page_ptr_id')}, {qn('body')}) VALUES (%s, %s)",
+                f"INSERT INTO {qn(HomePage._meta.db_table)} ({qn('page_ptr_id')}, {qn('body')}) VALUES (%s, %s)",
                 [root_page.id, ""],
             )
 
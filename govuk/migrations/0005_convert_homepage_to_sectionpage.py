@@ -30,29 +30,38 @@ def convert_homepages_to_sectionpages(apps, schema_editor):
     if not homepage_ids:
         return
 
-    homepage_rows = {
-        row.page_ptr_id: row
-        for row in HomePage.objects.using(db_alias).filter(page_ptr_id__in=homepage_ids)
-    }
     existing_section_rows = set(
         SectionPage.objects.using(db_alias)
         .filter(page_ptr_id__in=homepage_ids)
         .values_list("page_ptr_id", flat=True)
     )
+    page_ids_to_insert = [
+        page_id for page_id in homepage_ids if page_id not in existing_section_rows
+    ]
 
-    qn = schema_editor.connection.ops.quote_name
-    child_table = SectionPage._meta.db_table
-
-    with schema_editor.connection.cursor() as cursor:
-        for page_id in homepage_ids:
-            if page_id in existing_section_rows:
-                continue
+    if page_ids_to_insert:
+        homepage_bodies = dict(
+            HomePage.objects.using(db_alias)
+            .filter(page_ptr_id__in=page_ids_to_insert)
+            .values_list("page_ptr_id", "body")
+        )
+        qn = schema_editor.connection.ops.quote_name
+        columns = ", ".join(
+            qn(column)
+            for column in ("page_ptr_id", "hero_title", "hero_intro", "rows", "free_text")
+        )
+        insert_sql = (
+            f"INSERT INTO {qn(SectionPage._meta.db_table)} ({columns}) "
+            "VALUES (%s, %s, %s, %s, %s)"
+        )
 
-            homepage_row = homepage_rows.get(page_id)
-            body = getattr(homepage_row, "body", "") or ""
-            cursor.execute(
-                f"INSERT INTO {qn(child_table)} ({qn('page_ptr_id')}, {qn('hero_title')}, {qn('hero_intro')}, {qn('rows')}, {qn('free_text')}) VALUES (%s, %s, %s, %s, %s)",
-                [page_id, "", "", "[]", body],
+        with schema_editor.connection.cursor() as cursor:
+            cursor.executemany(
+                insert_sql,
+                [
+                    [page_id, "", "", "[]", homepage_bodies.get(page_id) or ""]
+                    for page_id in page_ids_to_insert
+                ],
             )
 
     Page.objects.using(db_alias).filter(id__in=homepage_ids).update(
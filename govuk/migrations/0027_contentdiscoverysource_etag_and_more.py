@@ -0,0 +1,23 @@
+# Generated by Django 6.1.2 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('govuk', '0026_rename_home_tables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contentdiscoverysource',
+            name='etag',
+            field=models.CharField(blank=True, editable=False, help_text='ETag returned by the source on its last successful sync.', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='contentdiscoverysource',
+            name='last_modified',
+            field=models.CharField(blank=True, editable=False, help_text='Last-Modified header returned by the source on its last successful sync.', max_length=64),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.1.2 on 2026-10-15 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('govuk', '0027_contentdiscoverysource_etag_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='externalcontentitem',
+            index=models.Index(fields=['hidden', '-last_seen_at'], name='govuk_eci_hidden_seen_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='externalcontentitem',
+            index=models.Index(fields=['hidden', 'source'], name='govuk_eci_hidden_source_idx'),
+        ),
+    ]
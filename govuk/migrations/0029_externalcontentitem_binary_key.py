@@ -0,0 +1,96 @@
+# Generated by Django 6.1.2 on 2026-10-15 23:24
+
+import hashlib
+from urllib.parse import urlsplit, urlunsplit
+
+from django.db import migrations, models
+
+
+# Mirrors govuk.models.canonical_url(), which every write path uses to build
+# item URLs and keys.
+def _canonical_url(url):
+    url = url.strip()
+    if not url:
+        return ""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    userinfo, at, host = parts.netloc.rpartition("@")
+    netloc = f"{userinfo}{at}{host.lower()}"
+    if scheme == parts.scheme and netloc == parts.netloc:
+        return url
+    return urlunsplit(parts._replace(scheme=scheme, netloc=netloc))
+
+
+def rebuild_binary_keys(apps, schema_editor):
+    ExternalContentItem = apps.get_model("govuk", "ExternalContentItem")
+    ExternalContentItemTag = apps.get_model("govuk", "ExternalContentItemTag")
+    db_alias = schema_editor.connection.alias
+
+    # Store every URL in its canonical form so existing items keep matching
+    # the entries of later syncs. URLs that only differed in the case of their
+    # scheme or host now name the same item, so the oldest row is kept and the
+    # others are merged into it.
+    items_by_url = {}
+    duplicate_ids_by_item_id = {}
+    for item in (
+        ExternalContentItem.objects.using(db_alias)
+        .only("pk", "url")
+        .order_by("pk")
+        .iterator()
+    ):
+        item.url = _canonical_url(item.url)
+        kept_item = items_by_url.setdefault(item.url, item)
+        if kept_item is not item:
+            duplicate_ids_by_item_id.setdefault(kept_item.pk, []).append(item.pk)
+
+    tag_rows = ExternalContentItemTag.objects.using(db_alias)
+    for item_id, duplicate_ids in duplicate_ids_by_item_id.items():
+        tag_ids = set(
+            tag_rows.filter(content_object_id=item_id).values_list("tag_id", flat=True)
+        )
+        tag_rows.bulk_create(
+            ExternalContentItemTag(content_object_id=item_id, tag_id=tag_id)
+            for tag_id in set(
+                tag_rows.filter(content_object_id__in=duplicate_ids).values_list(
+                    "tag_id", flat=True
+                )
+            )
+            - tag_ids
+        )
+        ExternalContentItem.objects.using(db_alias).filter(
+            pk__in=duplicate_ids
+        ).delete()
+
+    items = list(items_by_url.values())
+    for item in items:
+        item.key = hashlib.sha256(
+            item.url.encode("utf-8"), usedforsecurity=False
+        ).digest()[:16]
+
+    ExternalContentItem.objects.using(db_alias).bulk_update(
+        items, ["url", "key"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('govuk', '0028_externalcontentitem_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='externalcontentitem',
+            name='key',
+            field=models.BinaryField(help_text='First 16 bytes of the SHA256 hash of the URL.', max_length=16, unique=True),
+        ),
+        # The column type change keeps the old hex text, so rebuild every key
+        # from its URL.
+        migrations.RunPython(
+            code=rebuild_binary_keys,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-15 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('govuk', '0029_externalcontentitem_binary_key'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='externalcontentitem',
+            name='url',
+            field=models.URLField(help_text='Remote URL for the discovered content entry.', max_length=500),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.1.2 on 2026-10-15 23:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('govuk', '0030_alter_externalcontentitem_url'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='externalcontentitem',
+            options={'ordering': ['-last_seen_at', '-id']},
+        ),
+        migrations.AddIndex(
+            model_name='externalcontentitem',
+            index=models.Index(fields=['-last_seen_at', '-id'], name='govuk_eci_seen_id_idx'),
+        ),
+    ]
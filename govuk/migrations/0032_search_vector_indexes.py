@@ -0,0 +1,93 @@
+# Generated by Django 6.1.2 on 2026-10-15 23:45
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models.functions import Cast
+
+SEARCH_CONFIG = "english"
+
+
+# These expressions must match the vectors built in govuk.search_backend,
+# otherwise Postgres will not use the indexes for full text searches.
+def _search_indexes():
+    return [
+        (
+            "wagtailcore",
+            "Page",
+            GinIndex(
+                SearchVector("title", weight="A", config=SEARCH_CONFIG)
+                + SearchVector("seo_title", weight="B", config=SEARCH_CONFIG)
+                + SearchVector("search_description", weight="C", config=SEARCH_CONFIG),
+                name="govuk_page_search_idx",
+            ),
+        ),
+        (
+            "govuk",
+            "ContentPage",
+            GinIndex(
+                SearchVector("hero_title", weight="A", config=SEARCH_CONFIG)
+                + SearchVector(
+                    Cast("hero_intro", models.TextField()),
+                    weight="B",
+                    config=SEARCH_CONFIG,
+                ),
+                name="govuk_contentpage_hero_idx",
+            ),
+        ),
+        (
+            "govuk",
+            "SectionPage",
+            GinIndex(
+                SearchVector("hero_title", weight="A", config=SEARCH_CONFIG)
+                + SearchVector(
+                    Cast("hero_intro", models.TextField()),
+                    weight="B",
+                    config=SEARCH_CONFIG,
+                ),
+                name="govuk_sectionpage_hero_idx",
+            ),
+        ),
+        (
+            "govuk",
+            "SectionPage",
+            GinIndex(
+                SearchVector(
+                    Cast("rows", models.TextField()),
+                    weight="D",
+                    config=SEARCH_CONFIG,
+                ),
+                name="govuk_sectionpage_rows_idx",
+            ),
+        ),
+    ]
+
+
+# Full text search only runs on Postgres; other databases fall back to
+# icontains lookups and have no GIN indexes.
+def add_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for app_label, model_name, index in _search_indexes():
+        schema_editor.add_index(apps.get_model(app_label, model_name), index)
+
+
+def remove_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for app_label, model_name, index in _search_indexes():
+        schema_editor.remove_index(apps.get_model(app_label, model_name), index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('govuk', '0031_externalcontentitem_ordering_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=add_search_indexes,
+            reverse_code=remove_search_indexes,
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 6.1.2 on 2026-10-15 23:47
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from django.db.models.functions import Cast, Upper
+
+
+# icontains compiles to UPPER("column"::text) LIKE UPPER(...) on Postgres, so
+# the trigram indexes cover that exact expression.
+def _tag_indexes():
+    return [
+        GinIndex(
+            OpClass(Upper(Cast(field_name, models.TextField())), name="gin_trgm_ops"),
+            name=f"govuk_tag_{field_name}_trgm_idx",
+        )
+        for field_name in ("name", "slug")
+    ]
+
+
+def add_tag_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    GovukTag = apps.get_model("govuk", "GovukTag")
+    for index in _tag_indexes():
+        schema_editor.add_index(GovukTag, index)
+
+
+def remove_tag_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    GovukTag = apps.get_model("govuk", "GovukTag")
+    for index in _tag_indexes():
+        schema_editor.remove_index(GovukTag, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('govuk', '0032_search_vector_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(
+            code=add_tag_indexes,
+            reverse_code=remove_tag_indexes,
+        ),
+    ]
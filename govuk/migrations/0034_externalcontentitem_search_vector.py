@@ -0,0 +1,81 @@
+# Generated by Django 6.1.2 on 2026-10-15 23:54
+
+import django.contrib.postgres.search
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, StringAgg, Subquery, Value
+from django.db.models.functions import Concat
+
+SEARCH_CONFIG = "english"
+
+
+def _search_vector_index():
+    return GinIndex(fields=["search_vector"], name="govuk_eci_search_idx")
+
+
+# Mirrors ExternalContentItem.search_vector_expression().
+def _search_vector_expression(apps):
+    ContentDiscoverySource = apps.get_model("govuk", "ContentDiscoverySource")
+    ExternalContentItemTag = apps.get_model("govuk", "ExternalContentItemTag")
+    source_name = Subquery(
+        ContentDiscoverySource.objects.filter(pk=OuterRef("source_id"))
+        .order_by()
+        .values("name")
+    )
+    tags_text = Subquery(
+        ExternalContentItemTag.objects.filter(content_object_id=OuterRef("pk"))
+        .order_by()
+        .values("content_object_id")
+        .annotate(
+            text=StringAgg(
+                Concat("tag__slug", Value(" "), "tag__name"), delimiter=Value(" ")
+            )
+        )
+        .values("text")
+    )
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("summary", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("url", weight="C", config=SEARCH_CONFIG)
+        + SearchVector(source_name, weight="D", config=SEARCH_CONFIG)
+        + SearchVector(tags_text, weight="D", config=SEARCH_CONFIG)
+    )
+
+
+# Full text search only runs on Postgres; other databases leave the column
+# empty and search with icontains lookups.
+def add_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    ExternalContentItem = apps.get_model("govuk", "ExternalContentItem")
+    ExternalContentItem.objects.using(schema_editor.connection.alias).update(
+        search_vector=_search_vector_expression(apps)
+    )
+    schema_editor.add_index(ExternalContentItem, _search_vector_index())
+
+
+def remove_search_vector_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    ExternalContentItem = apps.get_model("govuk", "ExternalContentItem")
+    schema_editor.remove_index(ExternalContentItem, _search_vector_index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('govuk', '0033_govuktag_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='externalcontentitem',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            code=add_search_vectors,
+            reverse_code=remove_search_vector_index,
+        ),
+    ]
@@ -1,10 +1,16 @@
 import hashlib
+from itertools import batched
+from urllib.parse import urlsplit, urlunsplit
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.paginator import Paginator
-from django.db import models
-from django.db.models.functions import Coalesce
+from django.db import connections, models
+from django.db.models import Exists, OuterRef, StringAgg, Subquery, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.text import Truncator
 from modelcluster.contrib.taggit import ClusterTaggableManager
 from modelcluster.fields import ParentalKey
@@ -17,6 +23,31 @@ from wagtail.fields import RichTextField, StreamField
 from wagtail.models import Orderable, Page
 from wagtail.snippets.blocks import SnippetChooserBlock
 
+TAG_ASSIGNMENT_BATCH_SIZE = 500
+SEARCH_CONFIG = "english"
+# Fields that feed ExternalContentItem.search_vector besides its tags.
+EXTERNAL_SEARCH_FIELDS = frozenset({"title", "summary", "url", "source"})
+# Changing any of these makes a source's stored HTTP validators meaningless.
+SOURCE_FETCH_FIELDS = frozenset({"url", "default_tags", "disable_tls_verification"})
+
+
+def canonical_url(url: str) -> str:
+    # Scheme and host are case-insensitive; every write path normalises URLs
+    # here so the same item is always stored under the same URL and key.
+    url = url.strip()
+    if not url:
+        return ""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    userinfo, at, host = parts.netloc.rpartition("@")
+    netloc = f"{userinfo}{at}{host.lower()}"
+    if scheme == parts.scheme and netloc == parts.netloc:
+        return url
+    return urlunsplit(parts._replace(scheme=scheme, netloc=netloc))
+
 
 @register_setting(icon="warning")
 class PhaseBannerSettings(BaseSiteSetting):
@@ -239,6 +270,18 @@ class ContentDiscoverySource(Orderable):
         use_json_field=True,
         help_text="Optional tags to apply to discovered content from this source.",
     )
+    etag = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text="ETag returned by the source on its last successful sync.",
+    )
+    last_modified = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text="Last-Modified header returned by the source on its last successful sync.",
+    )
 
     panels = [
         FieldPanel("name"),
@@ -253,52 +296,110 @@ class ContentDiscoverySource(Orderable):
     def __str__(self) -> str:
         return self.name or self.url
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_fetch_settings = instance._fetch_settings()
+        return instance
+
+    def save(self, *args, **kwargs):
+        # A 304 for the old URL or settings would skip the first full import
+        # after an edit (and, for default tags, re-tagging existing items), so
+        # forget the validators whenever the fetch settings change.
+        update_fields = kwargs.get("update_fields")
+        loaded_settings = getattr(self, "_loaded_fetch_settings", None)
+        if (
+            loaded_settings is not None
+            and (update_fields is None or SOURCE_FETCH_FIELDS & set(update_fields))
+            and (self.etag or self.last_modified)
+            and self._fetch_settings() != loaded_settings
+        ):
+            self.clear_cache_validators()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "etag", "last_modified"}
+        super().save(*args, **kwargs)
+        self._loaded_fetch_settings = self._fetch_settings()
+
+    def _fetch_settings(self) -> tuple | None:
+        # Deferred fields are not loaded just to be compared.
+        if self.get_deferred_fields() & SOURCE_FETCH_FIELDS:
+            return None
+        return (
+            self.url,
+            self.disable_tls_verification,
+            self.get_raw_default_tag_ids(),
+        )
+
+    def clear_cache_validators(self) -> None:
+        """Forget the HTTP validators so the next sync fetches the source in full."""
+        self.etag = ""
+        self.last_modified = ""
+
     @staticmethod
     def _extract_tag_id(value) -> int | None:
-        if type(value) is int and value > 0:
-            return value
+        # Raw stream blocks ({"type": "tag", "value": <id>}) are the common
+        # input, so plain ints and dicts are checked first. ``type() is int``
+        # deliberately rejects booleans.
+        if type(value) is int:
+            return value if value > 0 else None
+        if isinstance(value, dict):
+            for key in ("value", "id", "pk"):
+                candidate = value.get(key)
+                if type(candidate) is int:
+                    extracted = candidate if candidate > 0 else None
+                else:
+                    extracted = ContentDiscoverySource._extract_tag_id(candidate)
+                if extracted:
+                    return extracted
+            return None
         if isinstance(value, str):
             stripped = value.strip()
             if stripped.isdigit():
                 parsed = int(stripped)
                 if parsed > 0:
                     return parsed
+            return None
         tag_pk = getattr(value, "pk", None)
         if type(tag_pk) is int and tag_pk > 0:
             return tag_pk
-        if isinstance(value, dict):
-            for key in ("value", "id", "pk"):
-                extracted = ContentDiscoverySource._extract_tag_id(value.get(key))
-                if extracted:
-                    return extracted
         return None
 
     def get_default_tag_ids(self) -> list[int]:
-        tag_ids: list[int] = []
-        seen: set[int] = set()
+        # An empty stream has nothing to read or resolve.
+        if not getattr(self.default_tags, "raw_data", None):
+            return []
+
+        # The stored stream data already holds the tag IDs, so read it first
+        # and only resolve the chooser blocks (one tag query) if it has none.
+        tag_ids = self.get_raw_default_tag_ids()
+        if tag_ids:
+            return tag_ids
 
+        seen: set[int] = set()
         for block in self.default_tags:
             tag_id = self._extract_tag_id(getattr(block, "value", None))
             if tag_id and tag_id not in seen:
                 tag_ids.append(tag_id)
                 seen.add(tag_id)
+        return tag_ids
 
-        # Some environments return chooser values as raw IDs in JSON;
-        # fall back to raw stream data if resolved block values yielded none.
-        if not tag_ids:
-            for raw_block in getattr(self.default_tags, "raw_data", []) or []:
-                tag_id = self._extract_tag_id(raw_block)
-                if tag_id and tag_id not in seen:
-                    tag_ids.append(tag_id)
-                    seen.add(tag_id)
+    def get_raw_default_tag_ids(self) -> list[int]:
+        """Return default tag IDs from the stored stream data without loading tags."""
+        tag_ids: list[int] = []
+        for raw_block in getattr(self.default_tags, "raw_data", []) or []:
+            tag_id = self._extract_tag_id(raw_block)
+            if tag_id and tag_id not in tag_ids:
+                tag_ids.append(tag_id)
         return tag_ids
 
     def get_default_tags(self) -> list["GovukTag"]:
-        tag_ids = self.get_default_tag_ids()
+        # Missing tags are dropped by the lookup below, so the raw IDs give the
+        # same result as resolving the chooser blocks without a second query.
+        tag_ids = self.get_raw_default_tag_ids()
         if not tag_ids:
             return []
 
-        tags_by_id = {tag.pk: tag for tag in GovukTag.objects.filter(pk__in=tag_ids)}
+        tags_by_id = GovukTag.objects.in_bulk(tag_ids)
         return [tags_by_id[tag_id] for tag_id in tag_ids if tag_id in tags_by_id]
 
 
@@ -320,12 +421,11 @@ class ExternalContentItemTag(TaggedItemBase):
 
 
 class ExternalContentItem(ClusterableModel):
-    key = models.CharField(
-        max_length=64,
+    key = models.BinaryField(
+        max_length=16,
         unique=True,
         editable=False,
-        db_index=True,
-        help_text="SHA256 hash of the URL.",
+        help_text="First 16 bytes of the SHA256 hash of the URL.",
     )
     source = models.ForeignKey(
         "govuk.ContentDiscoverySource",
@@ -334,9 +434,10 @@ class ExternalContentItem(ClusterableModel):
         null=True,
         related_name="external_content_items",
     )
+    # Uniqueness is enforced through the narrow hashed ``key`` index instead of
+    # a second unique index over the full URL.
     url = models.URLField(
         max_length=500,
-        unique=True,
         help_text="Remote URL for the discovered content entry.",
     )
     title = models.CharField(
@@ -375,6 +476,9 @@ class ExternalContentItem(ClusterableModel):
     )
     first_seen_at = models.DateTimeField(auto_now_add=True)
     last_seen_at = models.DateTimeField(auto_now=True)
+    # Kept up to date by update_search_vectors() on Postgres, where it backs a
+    # GIN index for full text search. Other databases leave it empty.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     panels = [
         FieldPanel("source"),
@@ -390,45 +494,153 @@ class ExternalContentItem(ClusterableModel):
     ]
 
     class Meta:
-        ordering = ["-last_seen_at", "title", "url"]
+        # Break ties on id rather than title and URL so the default ordering
+        # can be read straight from an index.
+        ordering = ["-last_seen_at", "-id"]
+        indexes = [
+            models.Index(fields=["-last_seen_at", "-id"], name="govuk_eci_seen_id_idx"),
+            models.Index(
+                fields=["hidden", "-last_seen_at"], name="govuk_eci_hidden_seen_idx"
+            ),
+            models.Index(
+                fields=["hidden", "source"], name="govuk_eci_hidden_source_idx"
+            ),
+        ]
 
     @staticmethod
-    def build_key(url: str) -> str:
-        return hashlib.sha256(url.strip().encode("utf-8")).hexdigest()
+    def build_key(url: str) -> bytes:
+        # The key identifies content rather than protecting anything, which also
+        # keeps it usable on FIPS-restricted OpenSSL builds. 128 bits is ample
+        # for deduplicating URLs and keeps the unique index narrow.
+        return hashlib.sha256(
+            canonical_url(url).encode("utf-8"), usedforsecurity=False
+        ).digest()[:16]
 
     def save(self, *args, **kwargs):
-        self.url = self.url.strip()
-        self.key = self.build_key(self.url)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "url" in update_fields:
+            self.url = canonical_url(self.url)
+            self.key = self.build_key(self.url)
         super().save(*args, **kwargs)
+        # Tags are committed by ClusterableModel.save(), so the vector is
+        # rebuilt afterwards.
+        if update_fields is None or EXTERNAL_SEARCH_FIELDS & set(update_fields):
+            self.update_search_vectors(type(self).objects.filter(pk=self.pk))
+
+    def clean(self):
+        super().clean()
+        # Items are deduplicated on the hashed key, which the admin form
+        # cannot see, so check for an existing item with the same URL here.
+        if (
+            self.url
+            and type(self)
+            .objects.filter(key=self.build_key(self.url))
+            .exclude(pk=self.pk)
+            .exists()
+        ):
+            raise ValidationError(
+                {"url": "External content item with this Url already exists."}
+            )
+
+    @classmethod
+    def search_vector_expression(cls) -> SearchVector:
+        source_name = Subquery(
+            ContentDiscoverySource.objects.filter(pk=OuterRef("source_id"))
+            .order_by()
+            .values("name")
+        )
+        tags_text = Subquery(
+            ExternalContentItemTag.objects.filter(content_object_id=OuterRef("pk"))
+            .order_by()
+            .values("content_object_id")
+            .annotate(
+                text=StringAgg(
+                    Concat("tag__slug", Value(" "), "tag__name"), delimiter=Value(" ")
+                )
+            )
+            .values("text")
+        )
+        return (
+            SearchVector("title", weight="A", config=SEARCH_CONFIG)
+            + SearchVector("summary", weight="B", config=SEARCH_CONFIG)
+            + SearchVector("url", weight="C", config=SEARCH_CONFIG)
+            + SearchVector(source_name, weight="D", config=SEARCH_CONFIG)
+            + SearchVector(tags_text, weight="D", config=SEARCH_CONFIG)
+        )
+
+    @classmethod
+    def update_search_vectors(cls, queryset: models.QuerySet | None = None) -> None:
+        """Rebuild the stored search vector for the given items (default: all)."""
+        if queryset is None:
+            queryset = cls.objects.all()
+        if connections[queryset.db].vendor != "postgresql":
+            return
+        queryset.update(search_vector=cls.search_vector_expression())
 
     def __str__(self) -> str:
         return self.title or self.url
 
     @classmethod
     def upsert_from_url(cls, *, url: str, source=None, **defaults):
-        normalized_url = url.strip()
+        # Syncs bulk upsert their entries in sync_content_discovery_source(), so
+        # this only serves one-off callers; update_or_create() saves through
+        # save(), which keeps the key, search vector and search cache current.
+        normalized_url = canonical_url(url)
         item, _ = cls.objects.update_or_create(
-            url=normalized_url,
-            defaults={"source": source, **defaults},
+            key=cls.build_key(normalized_url),
+            defaults={"url": normalized_url, "source": source, **defaults},
         )
         if source:
-            source_tags = source.get_default_tags()
-            if source_tags:
-                existing_tag_ids = set(
-                    item.tagged_items.values_list("tag_id", flat=True)
-                )
-                rows_to_add = [
-                    ExternalContentItemTag(content_object=item, tag=source_tag)
-                    for source_tag in source_tags
-                    if source_tag.pk not in existing_tag_ids
-                ]
-                if rows_to_add:
-                    ExternalContentItemTag.objects.bulk_create(
-                        rows_to_add,
-                        ignore_conflicts=True,
-                    )
+            cls.add_tags_to_items([item.pk], source.get_default_tags())
         return item
 
+    @staticmethod
+    def add_tags_to_items(
+        item_ids: list[int], tags: list["GovukTag"], *, refresh_vectors: bool = True
+    ) -> set[int]:
+        """
+        Tag the given items, skipping tags they already have.
+
+        Returns the IDs of the items that gained a tag. Their search vectors are
+        rebuilt unless ``refresh_vectors`` is false, for callers that refresh
+        them along with other changes.
+        """
+        if not item_ids or not tags:
+            return set()
+
+        # The through table has no unique constraint, so existing pairs must be
+        # looked up; batching keeps each IN list under database parameter limits.
+        tag_ids = [tag.pk for tag in tags]
+        rows_to_add = []
+        for item_id_batch in batched(item_ids, TAG_ASSIGNMENT_BATCH_SIZE):
+            existing_pairs = set(
+                ExternalContentItemTag.objects.filter(
+                    content_object_id__in=item_id_batch,
+                    tag_id__in=tag_ids,
+                ).values_list("content_object_id", "tag_id")
+            )
+            rows_to_add.extend(
+                ExternalContentItemTag(content_object_id=item_id, tag=tag)
+                for item_id in item_id_batch
+                for tag in tags
+                if (item_id, tag.pk) not in existing_pairs
+            )
+        if not rows_to_add:
+            return set()
+
+        ExternalContentItemTag.objects.bulk_create(
+            rows_to_add,
+            batch_size=TAG_ASSIGNMENT_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        tagged_item_ids = {row.content_object_id for row in rows_to_add}
+        if refresh_vectors:
+            for item_id_batch in batched(tagged_item_ids, TAG_ASSIGNMENT_BATCH_SIZE):
+                ExternalContentItem.update_search_vectors(
+                    ExternalContentItem.objects.filter(pk__in=item_id_batch)
+                )
+        return tagged_item_ids
+
 
 class ContentPageTag(TaggedItemBase):
     content_object = ParentalKey(
@@ -600,21 +812,36 @@ class TagListingsPage(Page):
         FieldPanel("enable_free_text_heading_navigation"),
     ]
 
+    @cached_property
+    def _configured_tags(self):
+        # Pages are loaded per request, so the tags are read once per render.
+        return list(self.tags.all())
+
     def get_listing_queryset(self):
         # Keep this as the single data-source entry point so other tagged card
         # sources can be merged in future.
         queryset = ExternalContentItem.objects.filter(hidden=False)
-        configured_tag_ids = list(self.tags.values_list("id", flat=True))
+        configured_tag_ids = [tag.id for tag in self._configured_tags]
         if configured_tag_ids:
-            queryset = queryset.filter(tags__id__in=configured_tag_ids)
+            # EXISTS avoids joining one row per matching tag and then needing
+            # DISTINCT to collapse them again.
+            queryset = queryset.filter(
+                Exists(
+                    ExternalContentItemTag.objects.filter(
+                        content_object_id=OuterRef("pk"),
+                        tag_id__in=configured_tag_ids,
+                    )
+                )
+            )
 
-        return queryset.distinct()
+        return queryset
 
     def get_context(self, request, *args, **kwargs):
         context = super().get_context(request, *args, **kwargs)
+        available_tags = self._configured_tags
+        listing_queryset = self.get_listing_queryset()
         queryset = (
-            self.get_listing_queryset()
-            .annotate(
+            listing_queryset.annotate(
                 sort_updated=Coalesce(
                     "updated_at",
                     "created_at",
@@ -624,62 +851,63 @@ class TagListingsPage(Page):
                 )
             )
             .order_by("-sort_updated", "-id")
+            # Cards show their source name; tags are not rendered per card.
+            .select_related("source")
         )
 
-        available_tags = list(self.tags.all())
         selected_tag = None
         selected_tag_slug = ""
         if self.enable_tag_filter:
             selected_tag_slug = (request.GET.get("tag") or "").strip().lower()
             if selected_tag_slug:
-                selected_tag = next(
-                    (tag for tag in available_tags if tag.slug == selected_tag_slug),
-                    None,
-                )
+                tags_by_slug = {tag.slug: tag for tag in available_tags}
+                selected_tag = tags_by_slug.get(selected_tag_slug)
                 if selected_tag is not None:
-                    queryset = queryset.filter(tags__id=selected_tag.id)
+                    queryset = queryset.filter(
+                        Exists(
+                            ExternalContentItemTag.objects.filter(
+                                content_object_id=OuterRef("pk"),
+                                tag_id=selected_tag.id,
+                            )
+                        )
+                    )
 
-        available_sources = []
         selected_source_id = ""
         selected_source_label = ""
+        # Resolve the display label in SQL so only usable rows come back.
         source_rows = (
-            self.get_listing_queryset()
-            .exclude(source__isnull=True)
-            .values("source_id", "source__name", "source__url")
+            listing_queryset.exclude(source__isnull=True)
+            .values("source_id")
+            .annotate(
+                label=Coalesce(
+                    NullIf(Trim("source__name"), Value("")),
+                    Trim("source__url"),
+                    output_field=models.CharField(),
+                )
+            )
+            .exclude(label="")
             .distinct()
-            .order_by("source__name", "source__url")
+            .order_by("label", "source_id")
         )
-        for source_row in source_rows:
-            source_id = source_row["source_id"]
-            if source_id is None:
-                continue
-            source_label = (
-                source_row["source__name"] or source_row["source__url"] or ""
-            ).strip()
-            if not source_label:
-                continue
-            available_sources.append(
-                {
-                    "id": str(source_id),
-                    "label": source_label,
-                }
-            )
+        sources_by_id = {
+            source_row["source_id"]: {
+                "id": str(source_row["source_id"]),
+                "label": source_row["label"],
+            }
+            for source_row in source_rows
+        }
+        available_sources = list(sources_by_id.values())
 
         if self.enable_source_filter:
-            selected_source_id = (request.GET.get("source") or "").strip()
-            selected_source = next(
-                (
-                    source
-                    for source in available_sources
-                    if source["id"] == selected_source_id
-                ),
-                None,
-            )
+            try:
+                source_id = int((request.GET.get("source") or "").strip())
+            except ValueError:
+                source_id = None
+            selected_source = sources_by_id.get(source_id)
             if selected_source is not None:
-                queryset = queryset.filter(source_id=int(selected_source_id))
+                queryset = queryset.filter(source_id=source_id)
+                selected_source_id = selected_source["id"]
                 selected_source_label = selected_source["label"]
-            else:
-                selected_source_id = ""
 
         paginator = Paginator(queryset, 15)
         context["listing_items"] = paginator.get_page(request.GET.get("page"))
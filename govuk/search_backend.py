@@ -1,29 +1,53 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import hashlib
+
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from itertools import batched
+from typing import Any, Iterator
+from uuid import uuid4
 
 from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.cache import cache
 from django.core.paginator import Page as PaginatorPage
 from django.core.paginator import Paginator
 from django.db import connections
-from django.db.models import Q, QuerySet, TextField
+from django.db.models import (
+    Exists,
+    F,
+    OuterRef,
+    Q,
+    QuerySet,
+    TextField,
+    prefetch_related_objects,
+)
 from django.db.models.functions import Cast
 from django.utils.html import strip_tags
 from django.utils import timezone
 from wagtail.models import Page, Site
 
-from govuk.models import ContentPage, ExternalContentItem, SectionPage
+from govuk.context_processors import NAVIGATION_PAGE_FIELDS
+from govuk.models import (
+    SEARCH_CONFIG,
+    TAG_ASSIGNMENT_BATCH_SIZE,
+    ContentDiscoverySource,
+    ContentPage,
+    ExternalContentItem,
+    GovukTag,
+    SectionPage,
+)
 
 DEFAULT_PAGE_SIZE = 15
-SEARCH_CONFIG = "english"
 SEARCH_WEIGHTS = [0.1, 0.2, 0.4, 1.0]
 PAGE_TAG_TEXT_WEIGHT = 0.75
 CARD_TAG_TEXT_WEIGHT = 1.0
 TAG_RESULT_WEIGHT = 1.2
 EXTERNAL_SOURCE_TEXT_WEIGHT = 0.4
 EXTERNAL_TAG_TEXT_WEIGHT = 0.6
+SEARCH_CACHE_TIMEOUT = 60
+SEARCH_CACHE_VERSION_KEY = "govuk:search:version"
 EXTERNAL_RECENCY_BOOST_BUCKETS: tuple[tuple[int, float], ...] = (
     (7, 8.0),
     (30, 5.0),
@@ -33,6 +57,110 @@ EXTERNAL_RECENCY_BOOST_BUCKETS: tuple[tuple[int, float], ...] = (
 )
 
 
+# The page, hero and card vectors below are matched with @@ so that the GIN
+# expression indexes from migration 0032 can serve them. Those indexes only
+# apply while these expressions stay identical to the indexed ones.
+def page_search_vector() -> SearchVector:
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("seo_title", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("search_description", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def hero_search_vector() -> SearchVector:
+    return SearchVector("hero_title", weight="A", config=SEARCH_CONFIG) + SearchVector(
+        Cast("hero_intro", TextField()), weight="B", config=SEARCH_CONFIG
+    )
+
+
+def section_rows_search_vector() -> SearchVector:
+    return SearchVector(Cast("rows", TextField()), weight="D", config=SEARCH_CONFIG)
+
+
+def invalidate_search_cache(**kwargs):
+    """
+    Retire every cached set of search results.
+
+    Like the navigation cache, entries share a version token, so replacing it
+    invalidates them all at once.
+
+    No CACHES setting is configured, so the token lives in the default
+    per-process LocMemCache. Invalidations triggered outside a web worker,
+    such as by the sync_external_content command, do not reach the workers;
+    their entries expire after SEARCH_CACHE_TIMEOUT instead.
+    """
+    cache.set(SEARCH_CACHE_VERSION_KEY, uuid4().hex, None)
+
+
+def invalidate_search_cache_for_instance(sender, instance, **kwargs):
+    # Results embed source names, so source saves retire them too.
+    if isinstance(
+        instance, (Page, ExternalContentItem, GovukTag, ContentDiscoverySource)
+    ):
+        invalidate_search_cache()
+
+
+def update_external_search_vectors_for_instance(
+    sender, instance, update_fields=None, **kwargs
+):
+    # Item vectors embed their source's name and their tags' names and slugs,
+    # so saves of other fields (such as sync validators) leave them alone.
+    if isinstance(instance, GovukTag):
+        searched_fields = {"name", "slug"}
+        items = ExternalContentItem.objects.filter(tagged_items__tag=instance)
+    elif isinstance(instance, ContentDiscoverySource):
+        searched_fields = {"name"}
+        items = ExternalContentItem.objects.filter(source=instance)
+    else:
+        return
+    if update_fields is not None and not searched_fields & set(update_fields):
+        return
+    ExternalContentItem.update_search_vectors(items)
+
+
+def collect_external_items_for_tag_delete(sender, instance, **kwargs):
+    # Deleting a tag cascades to its item links, so note the tagged items
+    # while the links still exist.
+    if _is_postgres(instance._state.db):
+        instance._tagged_external_item_ids = list(
+            ExternalContentItem.objects.filter(tagged_items__tag=instance)
+            .values_list("pk", flat=True)
+            .distinct()
+        )
+
+
+def update_external_search_vectors_after_tag_delete(sender, instance, **kwargs):
+    item_ids = getattr(instance, "_tagged_external_item_ids", None)
+    for item_id_batch in batched(item_ids or [], TAG_ASSIGNMENT_BATCH_SIZE):
+        ExternalContentItem.update_search_vectors(
+            ExternalContentItem.objects.filter(pk__in=item_id_batch)
+        )
+
+
+def _search_cache_version():
+    version = cache.get(SEARCH_CACHE_VERSION_KEY)
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(SEARCH_CACHE_VERSION_KEY, version, None):
+            version = cache.get(SEARCH_CACHE_VERSION_KEY, version)
+    return version
+
+
+@lru_cache(maxsize=8)
+def _is_postgres(db_alias: str) -> bool:
+    # A database alias keeps its backend for the life of the process.
+    return connections[db_alias].vendor == "postgresql"
+
+
+@lru_cache(maxsize=256)
+def _query_terms(query: str) -> tuple[str, tuple[str, ...]]:
+    # Every result of a search is scored against the same query, so split it
+    # once rather than for each row.
+    query_lower = query.lower()
+    return query_lower, tuple(query_lower.split())
+
+
 @dataclass(slots=True)
 class SearchResultItem:
     title: str
@@ -43,6 +171,39 @@ class SearchResultItem:
     tags: list[str] = field(default_factory=list)
     source_name: str = ""
     last_updated: datetime | None = None
+    # The page whose ancestors make up the breadcrumbs. The trail is only
+    # built for results on the requested page of the paginator.
+    page: Page | None = field(default=None, repr=False, compare=False)
+    include_page_in_breadcrumbs: bool = False
+
+
+class CachedSearchResults:
+    """
+    Cached search results for a paginator.
+
+    Entries are (result, page id) pairs. Only the slice the paginator asks for
+    has its pages loaded, with a single query.
+    """
+
+    def __init__(self, entries: list[tuple[SearchResultItem, int | None]]):
+        self._entries = entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index: int | slice):
+        if not isinstance(index, slice):
+            return self[index : index + 1 or None][0]
+
+        entries = self._entries[index]
+        pages = Page.objects.in_bulk(
+            [page_id for _result, page_id in entries if page_id is not None]
+        )
+        results = []
+        for result, page_id in entries:
+            result.page = pages.get(page_id)
+            results.append(result)
+        return results
 
 
 class SearchBackend:
@@ -56,15 +217,40 @@ class SearchBackend:
             paginator = Paginator([], self._page_size(filters))
             return paginator.get_page(page)
 
-        page_results = self._build_page_results(clean_query, filters)
-        hero_results = self._build_hero_results(clean_query, filters)
-        card_results = self._build_card_results(clean_query, filters)
-        tag_results = self._build_tag_results(clean_query, filters)
+        cache_key = self._cache_key(clean_query, filters)
+        cached_results = cache.get(cache_key)
+        if cached_results is None:
+            combined_results = self._combined_results(clean_query, filters)
+            # Pages are cached by id and reloaded for the requested window
+            # only, rather than pickling every matched page.
+            cache.set(
+                cache_key,
+                [
+                    (replace(item, page=None), item.page.pk if item.page else None)
+                    for item in combined_results
+                ],
+                SEARCH_CACHE_TIMEOUT,
+            )
+        else:
+            combined_results = CachedSearchResults(cached_results)
+
+        paginator = Paginator(combined_results, self._page_size(filters))
+        results_page = paginator.get_page(page)
+        self._add_breadcrumbs(results_page.object_list, filters)
+        return results_page
+
+    def _combined_results(
+        self, query: str, filters: dict[str, Any]
+    ) -> list[SearchResultItem]:
+        page_results = self._build_page_results(query, filters)
+        hero_results = self._build_hero_results(query, filters)
+        card_results = self._build_card_results(query, filters)
+        tag_results = self._build_tag_results(query, filters)
         external_content_results = self._build_external_content_results(
-            clean_query,
+            query,
             filters,
         )
-        combined_results = self._merge_results(
+        return self._merge_results(
             page_results
             + hero_results
             + card_results
@@ -72,26 +258,42 @@ class SearchBackend:
             + external_content_results
         )
 
-        paginator = Paginator(combined_results, self._page_size(filters))
-        return paginator.get_page(page)
+    def _cache_key(self, query: str, filters: dict[str, Any]) -> str:
+        site_or_root = filters.get("site")
+        fingerprint = repr(
+            (
+                query.lower(),
+                bool(filters.get("live", True)),
+                bool(filters.get("public", True)),
+                type(site_or_root).__name__,
+                getattr(site_or_root, "pk", None),
+                bool(filters.get("include_root", False)),
+                sorted(filters.get("exclude_ids") or ()),
+            )
+        )
+        digest = hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+        return f"govuk:search:{_search_cache_version()}:{digest}"
 
     def _build_page_results(
         self, query: str, filters: dict[str, Any]
     ) -> list[SearchResultItem]:
         queryset = self._apply_filters(Page.objects.all(), filters)
-        if self._is_postgres(queryset.db):
+        if _is_postgres(queryset.db):
             queryset = self._search_pages_postgres(queryset, query)
         else:
             queryset = self._search_pages_sqlite(queryset, query)
 
         request = filters.get("request")
-        site_root = self._site_root_page(filters)
         results: list[SearchResultItem] = []
-        for page in queryset:
-            specific_page = page.specific
+        # Load the specific pages per content type (keeping the rank
+        # annotation) and their tags in bulk rather than once per result.
+        # Page results never show StreamField content, so it is not fetched.
+        pages = list(queryset.defer_streamfields().specific())
+        self._prefetch_page_tags(pages)
+        for page in pages:
             title = page.title
             description = page.search_description or ""
-            tag_labels = self._page_tag_labels(specific_page)
+            tag_labels = self._page_tag_labels(page)
             tags_text = self._clean_text(" ".join(tag_labels))
             page_rank = float(getattr(page, "rank", 0.0) or 0.0)
             score = page_rank + self._text_relevance(
@@ -111,12 +313,7 @@ class SearchBackend:
                     search_description=description,
                     url=self._page_url(page, request),
                     score=score,
-                    breadcrumbs=self._page_breadcrumbs(
-                        page,
-                        request=request,
-                        site_root=site_root,
-                        include_page=False,
-                    ),
+                    page=page,
                     tags=tag_labels,
                     last_updated=self._page_last_updated(page),
                 )
@@ -127,13 +324,28 @@ class SearchBackend:
         self, query: str, filters: dict[str, Any]
     ) -> list[SearchResultItem]:
         section_pages = self._apply_filters(SectionPage.objects.all(), filters)
-        if self._is_postgres(section_pages.db):
+        if _is_postgres(section_pages.db):
             section_pages = self._search_sections_postgres(section_pages, query)
         else:
             section_pages = self._search_sections_sqlite(section_pages, query)
+        section_pages = list(section_pages.prefetch_related("tags"))
+
+        # Read cards from the stored stream data and load every card tag in
+        # one query, rather than resolving the chooser blocks per section.
+        cards_by_section = {
+            section_page.pk: list(self._section_cards(section_page))
+            for section_page in section_pages
+        }
+        tags_by_id = GovukTag.objects.in_bulk(
+            {
+                tag_id
+                for cards in cards_by_section.values()
+                for _card, tag_ids in cards
+                for tag_id in tag_ids
+            }
+        )
 
         request = filters.get("request")
-        site_root = self._site_root_page(filters)
         query_lower = query.lower()
         results: list[SearchResultItem] = []
 
@@ -141,14 +353,14 @@ class SearchBackend:
             section_url = self._page_url(section_page, request)
             section_rank = float(getattr(section_page, "card_rank", 0.0) or 0.0)
 
-            for card in self._section_cards(section_page):
+            for card, tag_ids in cards_by_section[section_page.pk]:
                 title = self._clean_text(card.get("title"))
                 text = self._clean_text(card.get("text"))
                 link_text = self._clean_text(card.get("link_text"))
                 link_url = (card.get("link_url") or "").strip()
                 card_tag_text: list[str] = []
                 card_tag_labels: list[str] = []
-                for tag in card.get("tags", []):
+                for tag in (tags_by_id.get(tag_id) for tag_id in tag_ids):
                     tag_text = self._tag_text(tag)
                     if tag_text:
                         card_tag_text.append(tag_text)
@@ -188,12 +400,8 @@ class SearchBackend:
                         ),
                         url=link_url or section_url,
                         score=score,
-                        breadcrumbs=self._page_breadcrumbs(
-                            section_page,
-                            request=request,
-                            site_root=site_root,
-                            include_page=True,
-                        ),
+                        page=section_page,
+                        include_page_in_breadcrumbs=True,
                         tags=result_tags,
                         last_updated=self._page_last_updated(section_page),
                     )
@@ -204,17 +412,27 @@ class SearchBackend:
     def _build_tag_results(
         self, query: str, filters: dict[str, Any]
     ) -> list[SearchResultItem]:
+        # Resolve the matching tags once, then select tagged pages with an
+        # EXISTS test instead of a DISTINCT over the tag joins.
+        tag_ids = list(
+            GovukTag.objects.filter(
+                Q(slug__icontains=query) | Q(name__icontains=query)
+            ).values_list("pk", flat=True)
+        )
+        if not tag_ids:
+            return []
+
         request = filters.get("request")
-        site_root = self._site_root_page(filters)
         results: list[SearchResultItem] = []
 
         for model in (ContentPage, SectionPage):
+            tagged_items = model.tags.through.objects.filter(
+                content_object_id=OuterRef("pk"), tag_id__in=tag_ids
+            )
             queryset = self._apply_filters(
-                model.objects.filter(
-                    Q(tags__slug__icontains=query) | Q(tags__name__icontains=query)
-                )
-                .prefetch_related("tags")
-                .distinct(),
+                model.objects.filter(Exists(tagged_items))
+                .defer_streamfields()
+                .prefetch_related("tags"),
                 filters,
             )
 
@@ -234,12 +452,7 @@ class SearchBackend:
                         search_description=description,
                         url=self._page_url(page, request),
                         score=score,
-                        breadcrumbs=self._page_breadcrumbs(
-                            page,
-                            request=request,
-                            site_root=site_root,
-                            include_page=False,
-                        ),
+                        page=page,
                         tags=tag_labels,
                         last_updated=self._page_last_updated(page),
                     )
@@ -251,15 +464,15 @@ class SearchBackend:
         self, query: str, filters: dict[str, Any]
     ) -> list[SearchResultItem]:
         request = filters.get("request")
-        site_root = self._site_root_page(filters)
         results: list[SearchResultItem] = []
 
         for model in (ContentPage, SectionPage):
-            queryset = self._apply_filters(model.objects.all(), filters)
-            if self._is_postgres(queryset.db):
+            queryset = self._apply_filters(model.objects.defer_streamfields(), filters)
+            if _is_postgres(queryset.db):
                 queryset = self._search_hero_postgres(queryset, query)
             else:
                 queryset = self._search_hero_sqlite(queryset, query)
+            queryset = queryset.prefetch_related("tags")
 
             for page in queryset:
                 hero_title = self._clean_text(getattr(page, "hero_title", ""))
@@ -281,12 +494,7 @@ class SearchBackend:
                         search_description=hero_intro or page.search_description or "",
                         url=self._page_url(page, request),
                         score=score,
-                        breadcrumbs=self._page_breadcrumbs(
-                            page,
-                            request=request,
-                            site_root=site_root,
-                            include_page=False,
-                        ),
+                        page=page,
                         tags=tag_labels,
                         last_updated=self._page_last_updated(page),
                     )
@@ -298,7 +506,7 @@ class SearchBackend:
         self, query: str, filters: dict[str, Any]
     ) -> list[SearchResultItem]:
         queryset = self._external_content_queryset(filters)
-        if self._is_postgres(queryset.db):
+        if _is_postgres(queryset.db):
             queryset = self._search_external_content_postgres(queryset, query)
         else:
             queryset = self._search_external_content_sqlite(queryset, query)
@@ -351,17 +559,13 @@ class SearchBackend:
         ).order_by("-first_published_at", "-latest_revision_created_at", "title")
 
     def _search_pages_postgres(self, queryset: QuerySet, query: str) -> QuerySet:
-        search_vector = (
-            SearchVector("title", weight="A", config=SEARCH_CONFIG)
-            + SearchVector("seo_title", weight="B", config=SEARCH_CONFIG)
-            + SearchVector("search_description", weight="C", config=SEARCH_CONFIG)
-        )
         search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
         return (
-            queryset.annotate(
-                rank=SearchRank(search_vector, search_query, weights=SEARCH_WEIGHTS),
+            queryset.annotate(page_search=page_search_vector())
+            .filter(page_search=search_query)
+            .annotate(
+                rank=SearchRank(F("page_search"), search_query, weights=SEARCH_WEIGHTS),
             )
-            .filter(rank__gt=0)
             .order_by("-rank", "-first_published_at", "title")
         )
 
@@ -371,17 +575,15 @@ class SearchBackend:
         )
 
     def _search_sections_postgres(self, queryset: QuerySet, query: str) -> QuerySet:
-        rows_vector = SearchVector(
-            Cast("rows", TextField()),
-            weight="D",
-            config=SEARCH_CONFIG,
-        )
         search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
         return (
-            queryset.annotate(
-                card_rank=SearchRank(rows_vector, search_query, weights=SEARCH_WEIGHTS),
+            queryset.annotate(rows_search=section_rows_search_vector())
+            .filter(rows_search=search_query)
+            .annotate(
+                card_rank=SearchRank(
+                    F("rows_search"), search_query, weights=SEARCH_WEIGHTS
+                ),
             )
-            .filter(card_rank__gt=0)
             .order_by("-card_rank", "-first_published_at", "title")
         )
 
@@ -391,17 +593,15 @@ class SearchBackend:
         ).order_by("-first_published_at", "-latest_revision_created_at", "title")
 
     def _search_hero_postgres(self, queryset: QuerySet, query: str) -> QuerySet:
-        hero_vector = SearchVector(
-            "hero_title", weight="A", config=SEARCH_CONFIG
-        ) + SearchVector(
-            Cast("hero_intro", TextField()), weight="B", config=SEARCH_CONFIG
-        )
         search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
         return (
-            queryset.annotate(
-                hero_rank=SearchRank(hero_vector, search_query, weights=SEARCH_WEIGHTS),
+            queryset.annotate(hero_search=hero_search_vector())
+            .filter(hero_search=search_query)
+            .annotate(
+                hero_rank=SearchRank(
+                    F("hero_search"), search_query, weights=SEARCH_WEIGHTS
+                ),
             )
-            .filter(hero_rank__gt=0)
             .order_by("-hero_rank", "-first_published_at", "title")
         )
 
@@ -426,22 +626,16 @@ class SearchBackend:
     def _search_external_content_postgres(
         self, queryset: QuerySet, query: str
     ) -> QuerySet:
-        search_vector = (
-            SearchVector("title", weight="A", config=SEARCH_CONFIG)
-            + SearchVector("summary", weight="B", config=SEARCH_CONFIG)
-            + SearchVector("url", weight="C", config=SEARCH_CONFIG)
-            + SearchVector("source__name", weight="D", config=SEARCH_CONFIG)
-            + SearchVector("tags__slug", weight="D", config=SEARCH_CONFIG)
-            + SearchVector("tags__name", weight="D", config=SEARCH_CONFIG)
-        )
+        # The stored vector already covers the source name and tags, so no
+        # joins (or DISTINCT) are needed and the GIN index can be used.
         search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
         return (
-            queryset.annotate(
+            queryset.filter(search_vector=search_query)
+            .annotate(
                 external_rank=SearchRank(
-                    search_vector, search_query, weights=SEARCH_WEIGHTS
+                    F("search_vector"), search_query, weights=SEARCH_WEIGHTS
                 ),
             )
-            .filter(external_rank__gt=0)
             .order_by(
                 "-external_rank",
                 "-updated_at",
@@ -450,7 +644,6 @@ class SearchBackend:
                 "-last_seen_at",
                 "title",
             )
-            .distinct()
         )
 
     def _apply_filters(self, queryset: QuerySet, filters: dict[str, Any]) -> QuerySet:
@@ -487,25 +680,31 @@ class SearchBackend:
             )
         return queryset.prefetch_related("tags")
 
-    def _is_postgres(self, db_alias: str) -> bool:
-        return connections[db_alias].vendor == "postgresql"
-
-    def _section_cards(self, section_page: SectionPage) -> list[dict[str, Any]]:
-        cards: list[dict[str, Any]] = []
-        for block in section_page.rows:
-            if block.block_type != "row":
+    def _section_cards(
+        self, section_page: SectionPage
+    ) -> Iterator[tuple[dict[str, Any], list[int]]]:
+        """Yield a section's raw card values from its stream data, with tag IDs."""
+        for raw_block in section_page.rows.raw_data:
+            if raw_block.get("type") != "row":
                 continue
-            for card in block.value.get("cards", []):
-                cards.append(
-                    {
-                        "title": card.get("title"),
-                        "text": card.get("text"),
-                        "link_text": card.get("link_text"),
-                        "link_url": card.get("link_url"),
-                        "tags": card.get("tags", []),
-                    }
-                )
-        return cards
+            row = raw_block.get("value") or {}
+            for card in self._list_block_values(row.get("cards")):
+                if not isinstance(card, dict):
+                    continue
+                tag_ids = [
+                    tag_id
+                    for tag_id in self._list_block_values(card.get("tags"))
+                    if type(tag_id) is int
+                ]
+                yield card, tag_ids
+
+    def _list_block_values(self, raw_items: Any) -> Iterator[Any]:
+        # ListBlock items are stored either as bare values or, in the newer
+        # format, as {"type": "item", "value": ..., "id": ...} dicts.
+        for raw_item in raw_items or []:
+            if isinstance(raw_item, dict) and "id" in raw_item and "value" in raw_item:
+                raw_item = raw_item["value"]
+            yield raw_item
 
     def _site_root_page(self, filters: dict[str, Any]) -> Page | None:
         site_or_root = filters.get("site")
@@ -515,19 +714,59 @@ class SearchBackend:
             return site_or_root
         return None
 
+    def _add_breadcrumbs(
+        self, results: list[SearchResultItem], filters: dict[str, Any]
+    ) -> None:
+        request = filters.get("request")
+        site_root = self._site_root_page(filters)
+        pages = [result.page for result in results if result.page is not None]
+        if not pages:
+            return
+
+        # Tree paths embed every ancestor's path as a prefix, so the ancestors
+        # of all visible results load in one query. Breadcrumbs only need
+        # titles and URLs, which the base Page provides.
+        ancestor_paths = {
+            path
+            for page in pages
+            for path in self._ancestor_paths(page, inclusive=True)
+        }
+        ancestors_by_path = {
+            ancestor.path: ancestor
+            for ancestor in Page.objects.filter(path__in=ancestor_paths).only(
+                *NAVIGATION_PAGE_FIELDS
+            )
+        }
+        for result in results:
+            if result.page is None:
+                continue
+            result.breadcrumbs = self._page_breadcrumbs(
+                result.page,
+                ancestors_by_path,
+                request=request,
+                site_root=site_root,
+                include_page=result.include_page_in_breadcrumbs,
+            )
+
+    def _ancestor_paths(self, page: Page, *, inclusive: bool) -> list[str]:
+        end = len(page.path) + (Page.steplen if inclusive else 0)
+        return [page.path[:length] for length in range(Page.steplen, end, Page.steplen)]
+
     def _page_breadcrumbs(
         self,
         page: Page,
+        ancestors_by_path: dict[str, Page],
         *,
         request,
         site_root: Page | None = None,
         include_page: bool = False,
     ) -> list[dict[str, str]]:
         breadcrumbs: list[dict[str, str]] = []
-        for ancestor in page.get_ancestors(inclusive=include_page).specific():
-            if site_root and not ancestor.path.startswith(site_root.path):
+        for path in self._ancestor_paths(page, inclusive=include_page):
+            ancestor = ancestors_by_path.get(path)
+            if ancestor is None:
                 continue
-            if not include_page and ancestor.pk == page.pk:
+            if site_root and not ancestor.path.startswith(site_root.path):
                 continue
 
             url = ancestor.get_url(request=request) or ancestor.url or "#"
@@ -586,7 +825,12 @@ class SearchBackend:
     def _clean_text(self, value: Any) -> str:
         if not value:
             return ""
-        return " ".join(strip_tags(str(value)).split())
+        text = str(value)
+        # Most card and tag values are plain text, which strip_tags would
+        # return unchanged.
+        if "<" in text:
+            text = strip_tags(text)
+        return " ".join(text.split())
 
     def _tag_text(self, tag: Any) -> str:
         if not tag:
@@ -627,17 +871,25 @@ class SearchBackend:
             unique_values.append(clean_value)
         return unique_values
 
+    def _prefetch_page_tags(self, pages: list[Page]) -> None:
+        pages_by_model: dict[type[Page], list[Page]] = {}
+        for page in pages:
+            if hasattr(page, "tags"):
+                pages_by_model.setdefault(type(page), []).append(page)
+        for model_pages in pages_by_model.values():
+            prefetch_related_objects(model_pages, "tags")
+
     def _page_tag_labels(self, page: Any) -> list[str]:
         tags_manager = getattr(page, "tags", None)
         if not tags_manager:
             return []
 
-        labels: list[str] = []
-        for tag in tags_manager.all():
-            label = self._tag_label(tag)
-            if label:
-                labels.append(label)
-        return self._unique_values(labels)
+        # Tag relations always hold GovukTag rows (prefetched by the callers),
+        # so read the name, falling back to the slug, without the generic
+        # chooser-value handling in _tag_label. _unique_values drops blanks.
+        return self._unique_values(
+            [self._clean_text(tag.name) or tag.slug for tag in tags_manager.all()]
+        )
 
     def _tag_result_description(self, page: Any) -> str:
         tags_manager = getattr(page, "tags", None)
@@ -663,31 +915,38 @@ class SearchBackend:
         return parsed_page_size if parsed_page_size > 0 else DEFAULT_PAGE_SIZE
 
     def _merge_results(self, results: list[SearchResultItem]) -> list[SearchResultItem]:
-        unique_results: list[SearchResultItem] = []
-        seen: set[tuple[str, str]] = set()
-
-        for item in sorted(results, key=lambda item: (-item.score, item.title.lower())):
-            key = (item.title.lower(), item.url)
-            if key in seen:
-                continue
-            seen.add(key)
-            unique_results.append(item)
-
-        return unique_results
+        # Drop duplicates before sorting, keeping the best scoring (and then
+        # earliest) copy, so only unique results are sorted. Entries sort as
+        # plain tuples; the position is unique, so items are never compared.
+        best_results: dict[
+            tuple[str, str], tuple[float, str, int, SearchResultItem]
+        ] = {}
+        for index, item in enumerate(results):
+            title_key = item.title.lower()
+            key = (title_key, item.url)
+            best = best_results.get(key)
+            if best is None or -item.score < best[0]:
+                best_results[key] = (-item.score, title_key, index, item)
+
+        return [item for *_sort_key, item in sorted(best_results.values())]
 
     def _text_relevance(
         self, query: str, weighted_values: tuple[tuple[Any, float], ...]
     ) -> float:
-        query_lower = query.lower()
-        terms = [term for term in query_lower.split() if term]
+        query_lower, terms = _query_terms(query)
         score = 0.0
 
         for value, weight in weighted_values:
             text = self._clean_text(value).lower()
             if not text:
                 continue
+            # Every term is part of the query, so a full match also matches
+            # each term, and a single-term query has nothing more to find.
             if query_lower in text:
-                score += 2.0 * weight
+                score += (2.0 + 0.5 * len(terms)) * weight
+                continue
+            if len(terms) == 1:
+                continue
             for term in terms:
                 if term in text:
                     score += 0.5 * weight
@@ -0,0 +1,124 @@
+import json
+from decimal import Decimal
+
+from django.contrib.auth.models import Group
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils.translation import gettext_lazy
+from wagtail.models import Page, PageViewRestriction
+
+from govuk.api import ORJSONRenderer, PagePrivacyField, attach_page_privacy
+
+
+class PagePrivacyFieldTests(TestCase):
+    def setUp(self):
+        self.page = Page.objects.get(depth=2)
+        self.group = Group.objects.create(name="Editors only")
+        restriction = PageViewRestriction.objects.create(
+            page=self.page, restriction_type=PageViewRestriction.GROUPS
+        )
+        restriction.groups.add(self.group)
+        self.restriction = restriction
+
+    def test_serializes_attached_privacy_without_extra_queries(self):
+        pages = list(Page.objects.filter(depth__lte=2))
+        with self.assertNumQueries(1):
+            attach_page_privacy(pages)
+        field = PagePrivacyField()
+
+        with self.assertNumQueries(0):
+            data = {page.pk: field.to_representation(page) for page in pages}
+
+        self.assertEqual(
+            data[self.page.pk],
+            {
+                "restricted": True,
+                "restrictions": [
+                    {
+                        "id": self.restriction.pk,
+                        "type": PageViewRestriction.GROUPS,
+                        "groups": [{"id": self.group.pk, "name": "Editors only"}],
+                    }
+                ],
+            },
+        )
+        self.assertEqual(
+            data[self.page.get_parent().pk], {"restricted": False, "restrictions": []}
+        )
+
+    def test_non_group_restrictions_have_no_groups(self):
+        restriction = PageViewRestriction.objects.create(
+            page=self.page.get_parent(), restriction_type=PageViewRestriction.LOGIN
+        )
+        page = attach_page_privacy([self.page.get_parent()])[0]
+
+        self.assertEqual(
+            page.api_privacy,
+            {
+                "restricted": True,
+                "restrictions": [{"id": restriction.pk, "type": "login"}],
+            },
+        )
+
+    def test_computes_privacy_for_pages_without_attached_privacy(self):
+        data = PagePrivacyField().to_representation(Page.objects.get(pk=self.page.pk))
+
+        self.assertTrue(data["restricted"])
+        self.assertEqual(
+            data["restrictions"][0]["groups"],
+            [{"id": self.group.pk, "name": "Editors only"}],
+        )
+
+    def test_pages_listing_includes_privacy(self):
+        self.restriction.delete()
+
+        response = self.client.get("/api/v2/pages/")
+
+        self.assertEqual(response.status_code, 200)
+        items = response.json()["items"]
+        self.assertTrue(items)
+        for item in items:
+            self.assertEqual(
+                item["meta"]["privacy"], {"restricted": False, "restrictions": []}
+            )
+
+
+@override_settings(WAGTAILADMIN_BASE_URL="https://example.gov.uk")
+class APIRootViewTests(TestCase):
+    def test_api_root_links_to_v2(self):
+        response = self.client.get("/api/")
+
+        self.assertEqual(
+            response.json(), {"versions": {"v2": "https://example.gov.uk/api/v2/"}}
+        )
+
+    def test_api_v2_root_lists_endpoints(self):
+        response = self.client.get("/api/v2/")
+
+        endpoints = response.json()["endpoints"]
+        self.assertEqual(list(endpoints), ["pages", "images", "documents"])
+        self.assertEqual(
+            endpoints["pages"],
+            {
+                "listing": "https://example.gov.uk/api/v2/pages/",
+                "detail": "https://example.gov.uk/api/v2/pages/{id}/",
+            },
+        )
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_renders_values_supported_by_drf_encoder(self):
+        rendered = ORJSONRenderer().render(
+            {"title": gettext_lazy("Home"), "score": Decimal("1.5"), 1: "one"}
+        )
+
+        self.assertEqual(
+            json.loads(rendered), {"title": "Home", "score": 1.5, "1": "one"}
+        )
+
+    def test_indents_when_requested(self):
+        rendered = ORJSONRenderer().render({"a": 1}, renderer_context={"indent": 4})
+
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')
+
+    def test_renders_compact_output_by_default(self):
+        self.assertEqual(ORJSONRenderer().render({"a": [1, 2]}), b'{"a":[1,2]}')
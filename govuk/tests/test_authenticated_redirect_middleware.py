@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
@@ -65,3 +65,34 @@ class AuthenticatedUserRedirectMiddlewareTests(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.content, b"ok")
+
+    @patch("govuk.middleware.Site.find_for_request")
+    def test_redirect_rule_is_resolved_with_one_query(self, mock_find_for_request):
+        mock_find_for_request.return_value = self.site
+        self._create_rule("/", "/dashboard")
+        request = self.factory.get("/")
+        request.user = self.user
+
+        with self.assertNumQueries(1):
+            response = self.middleware(request)
+
+        self.assertEqual(response["Location"], "/dashboard")
+
+    @patch("govuk.middleware.Site.find_for_request")
+    def test_off_site_destination_is_not_redirected(self, mock_find_for_request):
+        mock_find_for_request.return_value = self.site
+        self._create_rule("/", "https://elsewhere.example/")
+        request = self.factory.get("/")
+        request.user = self.user
+
+        for _ in range(2):
+            response = self.middleware(request)
+            self.assertEqual(response.status_code, 200)
+
+    def test_admin_path_does_not_load_user(self):
+        request = self.factory.get("/admin/pages/")
+        request.user = Mock(spec=[])
+
+        response = self.middleware(request)
+
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,56 @@
+import time
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from govuk.authentication import InternalAccessJWTAuthentication
+
+
+@patch.object(JWTStatelessUserAuthentication, "get_validated_token")
+class InternalAccessJWTAuthenticationTests(SimpleTestCase):
+    def setUp(self):
+        InternalAccessJWTAuthentication._validated_tokens.clear()
+        self.authentication = InternalAccessJWTAuthentication()
+
+    def test_caches_validated_tokens(self, mock_validate):
+        now = time.time()
+        mock_validate.return_value = {"iat": now - 60, "exp": now + 600}
+
+        first = self.authentication.get_validated_token(b"token")
+        second = self.authentication.get_validated_token(b"token")
+
+        self.assertIs(first, second)
+        mock_validate.assert_called_once_with(b"token")
+
+    def test_revalidates_expired_cached_tokens(self, mock_validate):
+        now = time.time()
+        mock_validate.return_value = {"iat": now - 60, "exp": now + 600}
+        self.authentication.get_validated_token(b"token")
+
+        with patch("govuk.authentication.time.time", return_value=now + 601):
+            self.authentication.get_validated_token(b"token")
+
+        self.assertEqual(mock_validate.call_count, 2)
+
+    def test_rejects_tokens_older_than_maximum_age(self, mock_validate):
+        mock_validate.return_value = {"iat": time.time() - 12 * 60 * 60}
+
+        with self.assertRaisesMessage(
+            InvalidToken, "Token is older than the maximum allowed 12 hours"
+        ):
+            self.authentication.get_validated_token(b"token")
+        self.assertEqual(InternalAccessJWTAuthentication._validated_tokens, {})
+
+    def test_rejects_invalid_issued_at_claims(self, mock_validate):
+        for claims, message in [
+            ({}, "Token has no 'iat' claim"),
+            ({"iat": "soon"}, "Token has invalid 'iat' claim"),
+            ({"iat": float("nan")}, "Token has invalid 'iat' claim"),
+            ({"iat": time.time() + 60}, "Token 'iat' claim is in the future"),
+        ]:
+            with self.subTest(claims=claims):
+                mock_validate.return_value = claims
+                with self.assertRaisesMessage(InvalidToken, message):
+                    self.authentication.get_validated_token(b"token")
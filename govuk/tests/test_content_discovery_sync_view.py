@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from wagtail.models import Site
+
+from govuk.content_discovery import FetchedSourceContent
+from govuk.models import (
+    ContentDiscoverySettings,
+    ContentDiscoverySource,
+    ExternalContentItem,
+)
+
+RSS_FEED = b"""<rss version="2.0">
+  <channel>
+    <item>
+      <title>Restored item</title>
+      <link>https://example.gov.uk/restored</link>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+@patch(
+    "govuk.content_discovery.fetch_source_content",
+    return_value=FetchedSourceContent(body=RSS_FEED, etag='"v2"'),
+)
+class ContentDiscoverySyncViewTests(TestCase):
+    def setUp(self):
+        self.site = Site.objects.get(is_default_site=True)
+        self.source = ContentDiscoverySource.objects.create(
+            settings=ContentDiscoverySettings.for_site(self.site),
+            sort_order=0,
+            url="https://example.gov.uk/feed.xml",
+            etag='"v1"',
+            last_modified="Tue, 02 Jan 2024 03:04:05 GMT",
+        )
+        self.admin_user = get_user_model().objects.create_superuser(
+            username="admin-user",
+            email="admin@example.gov.uk",
+            password="unused-password",
+        )
+        self.client.force_login(self.admin_user)
+
+    def _assert_fetched_in_full(self, mock_fetch):
+        self.assertEqual(mock_fetch.call_args.kwargs["etag"], "")
+        self.assertEqual(mock_fetch.call_args.kwargs["last_modified"], "")
+        self.assertTrue(
+            ExternalContentItem.objects.filter(
+                url="https://example.gov.uk/restored"
+            ).exists()
+        )
+        self.source.refresh_from_db()
+        self.assertEqual(self.source.etag, '"v2"')
+
+    def test_source_sync_ignores_stored_validators(self, mock_fetch):
+        response = self.client.post(
+            reverse("govuk_content_discovery_sync_source", args=[self.source.pk])
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self._assert_fetched_in_full(mock_fetch)
+
+    def test_site_sync_ignores_stored_validators(self, mock_fetch):
+        response = self.client.post(
+            reverse("govuk_content_discovery_sync_site", args=[self.site.pk])
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self._assert_fetched_in_full(mock_fetch)
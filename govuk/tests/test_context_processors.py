@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from wagtail.models import Page, Site
+
+from govuk.context_processors import navigation_and_breadcrumbs
+
+
+class NavigationAndBreadcrumbsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.site_root = Site.objects.get(is_default_site=True).root_page
+        self.guides = self.site_root.add_child(
+            instance=Page(title="Guides", slug="guides", show_in_menus=True)
+        )
+        self.guide = self.guides.add_child(
+            instance=Page(title="A guide", slug="a-guide")
+        )
+
+    def _context(self, path):
+        return navigation_and_breadcrumbs(RequestFactory().get(path))
+
+    def test_builds_navigation_and_breadcrumbs(self):
+        context = self._context(self.guide.url)
+
+        self.assertEqual(
+            context["service_navigation_items"],
+            [{"title": "Guides", "url": self.guides.url, "is_active": True}],
+        )
+        self.assertEqual(
+            context["breadcrumbs"],
+            [
+                {"title": self.site_root.title, "url": "/", "is_current": False},
+                {"title": "Guides", "url": self.guides.url, "is_current": False},
+                {"title": "A guide", "url": None, "is_current": True},
+            ],
+        )
+
+    def test_reuses_cached_navigation_until_pages_change(self):
+        self._context(self.guide.url)
+        with self.assertNumQueries(6):
+            context = self._context(self.guide.url)
+        self.assertEqual(len(context["breadcrumbs"]), 3)
+
+        self.guides.title = "All guides"
+        self.guides.save()
+
+        context = self._context("/")
+        self.assertEqual(
+            context["service_navigation_items"],
+            [{"title": "All guides", "url": self.guides.url, "is_active": False}],
+        )
+
+    def test_builds_navigation_without_specific_page_queries(self):
+        self._context("/")
+        cache.clear()
+
+        # Site lookup (2), routing (3), menu (1), ancestors (1), settings (2).
+        with self.assertNumQueries(9):
+            self._context(self.guide.url)
+
+    def test_skips_navigation_for_non_page_paths(self):
+        for path in ("/static/css/app.css", "/media/image.png", "/admin/pages/"):
+            with self.subTest(path=path), self.assertNumQueries(0):
+                context = self._context(path)
+            self.assertEqual(context["service_navigation_items"], [])
+            self.assertEqual(context["breadcrumbs"], [])
+            self.assertIsNone(context["footer_settings"])
+
+    def test_builds_navigation_for_pages_named_like_non_page_paths(self):
+        for slug in ("healthzone", "favicons-guide", "administration"):
+            page = self.site_root.add_child(instance=Page(title=slug, slug=slug))
+            with self.subTest(slug=slug):
+                context = self._context(page.url)
+                self.assertEqual(context["breadcrumbs"][-1]["title"], slug)
@@ -2,13 +2,23 @@ import shutil
 import tempfile
 from io import StringIO
 from pathlib import Path
+from unittest.mock import patch
 
+from django.core.exceptions import ValidationError
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from wagtail.models import Site
 
-from govuk.models import ContentDiscoverySettings, ContentDiscoverySource, GovukTag
+from govuk.models import (
+    ContentDiscoverySettings,
+    ContentDiscoverySource,
+    ExternalContentItem,
+    GovukTag,
+)
+from govuk.search_backend import _search_cache_version
 
 
 class ImportContentDiscoverySourcesCommandTests(TestCase):
@@ -139,3 +149,233 @@ class ImportContentDiscoverySourcesCommandTests(TestCase):
             ContentDiscoverySource.objects.filter(settings=settings).count(),
             0,
         )
+
+    def test_rejects_unknown_site_id(self):
+        csv_path = self._write_csv(
+            "\n".join(
+                [
+                    "url,site_id",
+                    f"https://example.com/feed.xml,{self.site.pk}",
+                    "https://example.org/feed.xml,9999",
+                ]
+            )
+        )
+
+        with self.assertRaisesMessage(
+            CommandError, "Row 3: site_id 9999 does not exist."
+        ):
+            call_command("import_content_discovery_sources", csv_path)
+
+    def test_appends_new_sources_after_existing_and_reuses_duplicate_rows(self):
+        settings = ContentDiscoverySettings.for_site(self.site)
+        ContentDiscoverySource.objects.create(
+            settings=settings, sort_order=4, url="https://example.com/existing.xml"
+        )
+        csv_path = self._write_csv(
+            "\n".join(
+                [
+                    "url,name",
+                    "https://example.com/new.xml,First",
+                    "https://example.com/existing.xml,Existing",
+                    "https://example.com/new.xml,Second",
+                ]
+            )
+        )
+
+        stdout = StringIO()
+        call_command(
+            "import_content_discovery_sources",
+            csv_path,
+            "--site-id",
+            str(self.site.pk),
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            list(
+                ContentDiscoverySource.objects.filter(settings=settings)
+                .order_by("sort_order")
+                .values_list("url", "name", "sort_order")
+            ),
+            [
+                ("https://example.com/existing.xml", "Existing", 4),
+                ("https://example.com/new.xml", "Second", 5),
+            ],
+        )
+        self.assertIn("created 1", stdout.getvalue())
+        self.assertIn("updated 2", stdout.getvalue())
+
+    def test_reads_padded_headers_short_rows_and_blank_lines(self):
+        csv_path = self._write_csv(
+            "\n".join(
+                [
+                    " URL ,Name,notes",
+                    "https://example.com/feed.xml , Example ,ignored",
+                    "",
+                    ",,",
+                    "https://example.org/feed.xml",
+                ]
+            )
+        )
+
+        stdout = StringIO()
+        call_command(
+            "import_content_discovery_sources",
+            csv_path,
+            "--site-id",
+            str(self.site.pk),
+            stdout=stdout,
+        )
+
+        settings = ContentDiscoverySettings.for_site(self.site)
+        self.assertEqual(
+            list(
+                ContentDiscoverySource.objects.filter(settings=settings)
+                .order_by("sort_order")
+                .values_list("url", "name")
+            ),
+            [
+                ("https://example.com/feed.xml", "Example"),
+                ("https://example.org/feed.xml", ""),
+            ],
+        )
+        self.assertIn("processed 2 row(s)", stdout.getvalue())
+        self.assertIn("skipped empty 1", stdout.getvalue())
+
+    def test_changing_fetch_settings_clears_stored_validators(self):
+        tag = GovukTag.objects.create(slug="news", name="News")
+        settings = ContentDiscoverySettings.for_site(self.site)
+        renamed, retagged = (
+            ContentDiscoverySource.objects.create(
+                settings=settings,
+                sort_order=sort_order,
+                url=url,
+                etag='"v1"',
+                last_modified="Tue, 02 Jan 2024 03:04:05 GMT",
+            )
+            for sort_order, url in enumerate(
+                ["https://example.com/feed.xml", "https://example.org/rss.xml"]
+            )
+        )
+        csv_path = self._write_csv(
+            "url,name,default_tags\n"
+            "https://example.com/feed.xml,Renamed,\n"
+            "https://example.org/rss.xml,,news\n"
+        )
+
+        call_command(
+            "import_content_discovery_sources",
+            csv_path,
+            "--site-id",
+            str(self.site.pk),
+            stdout=StringIO(),
+        )
+
+        renamed.refresh_from_db()
+        retagged.refresh_from_db()
+        self.assertEqual(renamed.etag, '"v1"')
+        self.assertEqual(retagged.get_default_tag_ids(), [tag.pk])
+        self.assertEqual((retagged.etag, retagged.last_modified), ("", ""))
+
+    def test_renaming_a_source_refreshes_its_item_search_vectors(self):
+        source = ContentDiscoverySource.objects.create(
+            settings=ContentDiscoverySettings.for_site(self.site),
+            sort_order=0,
+            name="Old name",
+            url="https://example.com/feed.xml",
+        )
+        item = ExternalContentItem.objects.create(
+            url="https://example.com/post", source=source
+        )
+        csv_path = self._write_csv("url,name\nhttps://example.com/feed.xml,New name\n")
+
+        cache_version = _search_cache_version()
+
+        with (
+            patch.object(ExternalContentItem, "update_search_vectors") as mock_update,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            call_command(
+                "import_content_discovery_sources",
+                csv_path,
+                "--site-id",
+                str(self.site.pk),
+                stdout=StringIO(),
+            )
+
+        mock_update.assert_called_once()
+        self.assertEqual(list(mock_update.call_args.args[0]), [item])
+        self.assertNotEqual(_search_cache_version(), cache_version)
+
+    def test_unchanged_default_tags_are_compared_without_loading_tags(self):
+        tag = GovukTag.objects.create(slug="news", name="News")
+        ContentDiscoverySource.objects.create(
+            settings=ContentDiscoverySettings.for_site(self.site),
+            sort_order=0,
+            url="https://example.com/feed.xml",
+            default_tags=[{"type": "tag", "value": tag.pk}],
+        )
+        csv_path = self._write_csv(
+            "url,default_tags\nhttps://example.com/feed.xml,news\n"
+        )
+
+        stdout = StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            call_command(
+                "import_content_discovery_sources",
+                csv_path,
+                "--site-id",
+                str(self.site.pk),
+                stdout=stdout,
+            )
+
+        self.assertIn("unchanged 1", stdout.getvalue())
+        tag_queries = [
+            query["sql"] for query in queries if "govuk_govuktag" in query["sql"]
+        ]
+        self.assertEqual(len(tag_queries), 1)
+
+    def test_settings_are_not_requeried_per_row(self):
+        settings = ContentDiscoverySettings.for_site(self.site)
+        for index in range(3):
+            ContentDiscoverySource.objects.create(
+                settings=settings,
+                sort_order=index,
+                url=f"https://example.com/{index}.xml",
+            )
+        csv_path = self._write_csv(
+            "url,name\n"
+            + "".join(f"https://example.com/{index}.xml,Renamed\n" for index in range(4))
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            call_command(
+                "import_content_discovery_sources",
+                csv_path,
+                "--site-id",
+                str(self.site.pk),
+                stdout=StringIO(),
+            )
+
+        settings_queries = [
+            query["sql"]
+            for query in queries
+            if 'FROM "govuk_contentdiscoverysettings"' in query["sql"]
+        ]
+        self.assertEqual(len(settings_queries), 1)
+
+    def test_invalid_url_is_rejected_without_saving(self):
+        csv_path = self._write_csv(
+            "url,name\nhttps://example.com/feed.xml,Valid\nnot-a-url,Invalid\n"
+        )
+
+        with self.assertRaises(ValidationError):
+            call_command(
+                "import_content_discovery_sources",
+                csv_path,
+                "--site-id",
+                str(self.site.pk),
+                stdout=StringIO(),
+            )
+
+        self.assertFalse(ContentDiscoverySource.objects.exists())
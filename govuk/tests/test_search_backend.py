@@ -1,16 +1,27 @@
+import json
+
 from datetime import timedelta
+from unittest.mock import patch
 
-from django.test import TestCase
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from wagtail.models import Site
 
 from govuk.models import (
     ContentDiscoverySettings,
     ContentDiscoverySource,
+    ContentPage,
     ExternalContentItem,
     GovukTag,
+    SectionPage,
+)
+from govuk.search_backend import (
+    SearchResultItem,
+    _search_cache_version,
+    search_backend,
 )
-from govuk.search_backend import search_backend
 
 
 class SearchBackendExternalContentRankingTests(TestCase):
@@ -95,3 +106,282 @@ class SearchBackendExternalContentRankingTests(TestCase):
         self.assertIn(source_match_item.url, urls_in_order)
         self.assertIn(title_match_item.url, urls_in_order)
         self.assertEqual(urls_in_order[0], title_match_item.url)
+
+
+class SearchBackendMergeResultsTests(SimpleTestCase):
+    def test_keeps_the_best_scoring_duplicate_in_score_order(self):
+        results = [
+            SearchResultItem("Beta", "", "/beta/", score=1.0),
+            SearchResultItem("Alpha", "", "/alpha/", score=2.0),
+            SearchResultItem("beta", "", "/beta/", score=3.0),
+            SearchResultItem("Gamma", "", "/gamma/", score=2.0),
+        ]
+
+        merged = search_backend._merge_results(results)
+
+        self.assertEqual(
+            [(item.title, item.score) for item in merged],
+            [("beta", 3.0), ("Alpha", 2.0), ("Gamma", 2.0)],
+        )
+
+
+class SearchBackendPageResultsTests(TestCase):
+    def setUp(self):
+        self.site = Site.objects.get(is_default_site=True)
+        self.tag = GovukTag.objects.create(slug="guidance", name="Guidance")
+        for number in range(3):
+            page = self.site.root_page.add_child(
+                instance=ContentPage(
+                    title=f"Bulk lookup guidance {number}",
+                    slug=f"bulk-lookup-guidance-{number}",
+                )
+            )
+            page.tags.add(self.tag)
+            page.save_revision().publish()
+
+    def test_loads_specific_pages_and_tags_in_bulk(self):
+        with CaptureQueriesContext(connection) as queries:
+            results = search_backend._build_page_results(
+                "bulk lookup guidance", {"site": self.site}
+            )
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual([result.tags for result in results], [["Guidance"]] * 3)
+        specific_queries = [
+            query["sql"]
+            for query in queries
+            if '"govuk_contentpage"."page_ptr_id"' in query["sql"]
+        ]
+        tag_queries = [
+            query["sql"] for query in queries if 'FROM "govuk_govuktag"' in query["sql"]
+        ]
+        self.assertEqual(len(specific_queries), 1)
+        self.assertEqual(len(tag_queries), 1)
+
+    def test_builds_breadcrumbs_for_the_requested_page_only(self):
+        results = search_backend.search(
+            "bulk lookup guidance", filters={"site": self.site, "page_size": 1}
+        )
+
+        self.assertEqual(
+            results.object_list[0].breadcrumbs,
+            [{"title": self.site.root_page.title, "url": "/"}],
+        )
+        self.assertEqual(
+            [result.breadcrumbs for result in results.paginator.object_list[1:]],
+            [[], []],
+        )
+
+    def test_loads_breadcrumb_ancestors_in_one_query(self):
+        results = search_backend._build_page_results(
+            "bulk lookup guidance", {"site": self.site}
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            search_backend._add_breadcrumbs(results, {"site": self.site})
+
+        self.assertEqual(
+            [result.breadcrumbs for result in results],
+            [[{"title": self.site.root_page.title, "url": "/"}]] * 3,
+        )
+        ancestor_queries = [
+            query["sql"]
+            for query in queries
+            if 'FROM "wagtailcore_page"' in query["sql"]
+            and '"wagtailcore_page"."path" IN' in query["sql"]
+        ]
+        self.assertEqual(len(ancestor_queries), 1)
+
+    def test_reuses_cached_results_for_later_pages(self):
+        filters = {"site": self.site, "page_size": 1}
+        first_page = search_backend.search("bulk lookup guidance", filters=filters)
+
+        with CaptureQueriesContext(connection) as queries:
+            second_page = search_backend.search(
+                "bulk lookup guidance", filters=filters, page=2
+            )
+
+        self.assertEqual(
+            second_page.object_list[0].url,
+            first_page.paginator.object_list[1].url,
+        )
+        self.assertEqual(second_page.object_list[0].breadcrumbs[0]["url"], "/")
+        self.assertFalse(
+            [query for query in queries if 'FROM "govuk_govuktag"' in query["sql"]]
+        )
+
+    def test_saving_a_page_invalidates_cached_results(self):
+        filters = {"site": self.site}
+        search_backend.search("bulk lookup guidance", filters=filters)
+
+        self.site.root_page.add_child(
+            instance=ContentPage(
+                title="Bulk lookup guidance 3", slug="bulk-lookup-guidance-3"
+            )
+        )
+
+        results = search_backend.search("bulk lookup guidance", filters=filters)
+        self.assertEqual(results.paginator.count, 4)
+
+
+class SearchBackendCardResultsTests(TestCase):
+    def setUp(self):
+        self.site = Site.objects.get(is_default_site=True)
+        self.tags = [
+            GovukTag.objects.create(slug="forms", name="Forms"),
+            GovukTag.objects.create(slug="design", name="Design"),
+        ]
+        plain_card = {
+            "title": "Widget guidance",
+            "text": "<p>How to <b>use</b> widgets</p>",
+            "link_text": "",
+            "link_url": "/widgets/",
+            "tags": [tag.pk for tag in self.tags],
+        }
+        # Cards saved by the editor wrap list items with an id.
+        item_card = dict(plain_card, title="Widget patterns", link_url="/patterns/")
+        item_card["tags"] = [
+            {"type": "item", "value": tag.pk, "id": str(tag.pk)} for tag in self.tags
+        ]
+        for slug, card in (
+            ("plain", plain_card),
+            ("items", {"type": "item", "value": item_card, "id": "card"}),
+        ):
+            rows = [{"type": "row", "value": {"heading": "", "cards": [card]}}]
+            self.site.root_page.add_child(
+                instance=SectionPage(title=slug, slug=slug, rows=json.dumps(rows))
+            )
+
+    def test_reads_cards_and_loads_their_tags_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            results = search_backend._build_card_results("widget", {"site": self.site})
+
+        self.assertEqual(
+            sorted(
+                (result.title, result.search_description, result.url, result.tags)
+                for result in results
+            ),
+            [
+                (
+                    "Widget guidance",
+                    "How to use widgets",
+                    "/widgets/",
+                    ["Forms", "Design"],
+                ),
+                (
+                    "Widget patterns",
+                    "How to use widgets",
+                    "/patterns/",
+                    ["Forms", "Design"],
+                ),
+            ],
+        )
+        tag_queries = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('SELECT "govuk_govuktag"')
+        ]
+        self.assertEqual(len(tag_queries), 1)
+
+
+class SearchBackendTagResultsTests(TestCase):
+    def setUp(self):
+        self.site = Site.objects.get(is_default_site=True)
+        tags = [
+            GovukTag.objects.create(slug="widgets", name="Widgets"),
+            GovukTag.objects.create(slug="widget-design", name="Widget design"),
+        ]
+        self.page = self.site.root_page.add_child(
+            instance=ContentPage(title="Components", slug="components")
+        )
+        self.page.tags.add(*tags)
+        self.page.save_revision().publish()
+
+    def test_lists_pages_with_matching_tags_once(self):
+        results = search_backend._build_tag_results("widget", {"site": self.site})
+
+        self.assertEqual(
+            [(result.title, result.tags) for result in results],
+            [("Components", ["Widgets", "Widget design"])],
+        )
+
+    def test_skips_page_queries_without_matching_tags(self):
+        with self.assertNumQueries(1):
+            results = search_backend._build_tag_results("gadget", {"site": self.site})
+
+        self.assertEqual(results, [])
+
+
+class SearchBackendDeferredFieldsTests(TestCase):
+    def setUp(self):
+        self.site = Site.objects.get(is_default_site=True)
+        tag = GovukTag.objects.create(slug="widgets", name="Widgets")
+        self.section = self.site.root_page.add_child(
+            instance=SectionPage(
+                title="Widget section",
+                slug="widget-section",
+                hero_title="Widget section hero",
+            )
+        )
+        self.section.tags.add(tag)
+        self.section.save_revision().publish()
+
+    def test_result_pages_do_not_load_stream_fields(self):
+        for build_results in (
+            search_backend._build_page_results,
+            search_backend._build_hero_results,
+            search_backend._build_tag_results,
+        ):
+            with self.subTest(build_results.__name__):
+                results = build_results("widget", {"site": self.site})
+
+                self.assertEqual(len(results), 1)
+                self.assertIn("rows", results[0].page.get_deferred_fields())
+
+
+@patch.object(ExternalContentItem, "update_search_vectors")
+class ExternalSearchVectorRefreshTests(TestCase):
+    def setUp(self):
+        self.source = ContentDiscoverySource.objects.create(
+            settings=ContentDiscoverySettings.for_site(
+                Site.objects.get(is_default_site=True)
+            ),
+            sort_order=0,
+            name="Example blog",
+            url="https://example.gov.uk/feed.xml",
+        )
+        self.tag = GovukTag.objects.create(slug="news", name="News")
+        self.item = ExternalContentItem.objects.create(
+            url="https://example.gov.uk/first", title="First", source=self.source
+        )
+        ExternalContentItem.add_tags_to_items([self.item.pk], [self.tag])
+
+    def _refreshed_item_ids(self, mock_update):
+        return [
+            set(call.args[0].values_list("pk", flat=True))
+            for call in mock_update.call_args_list
+        ]
+
+    def test_source_saves_only_refresh_items_when_the_name_changes(self, mock_update):
+        self.source.etag = '"v1"'
+        self.source.save(update_fields=["etag"])
+        mock_update.assert_not_called()
+
+        self.source.name = "Renamed blog"
+        self.source.save(update_fields=["name"])
+        self.assertEqual(self._refreshed_item_ids(mock_update), [{self.item.pk}])
+
+    def test_saving_a_source_invalidates_cached_results(self, mock_update):
+        cache_version = _search_cache_version()
+
+        self.source.name = "Renamed blog"
+        self.source.save()
+
+        self.assertNotEqual(_search_cache_version(), cache_version)
+
+    @patch("govuk.search_backend._is_postgres", return_value=True)
+    def test_deleting_a_tag_refreshes_its_former_items(self, _is_postgres, mock_update):
+        self.tag.delete()
+
+        self.assertEqual(self._refreshed_item_ids(mock_update), [{self.item.pk}])
+        self.assertFalse(self.item.tagged_items.exists())
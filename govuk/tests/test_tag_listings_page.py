@@ -0,0 +1,138 @@
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from wagtail.models import Site
+
+from govuk.models import (
+    ContentDiscoverySettings,
+    ContentDiscoverySource,
+    ExternalContentItem,
+    GovukTag,
+    TagListingsPage,
+    TagListingsPageTag,
+)
+
+
+class TagListingsPageTests(TestCase):
+    def setUp(self):
+        site = Site.objects.get(is_default_site=True)
+        self.tag = GovukTag.objects.create(slug="news", name="News")
+        other_tag = GovukTag.objects.create(slug="other", name="Other")
+        self.page = site.root_page.add_child(
+            instance=TagListingsPage(title="News", slug="news")
+        )
+        TagListingsPageTag.objects.create(content_object=self.page, tag=self.tag)
+
+        self.source = ContentDiscoverySource.objects.create(
+            settings=ContentDiscoverySettings.for_site(site),
+            sort_order=0,
+            name="Example blog",
+            url="https://example.gov.uk/feed.xml",
+        )
+        self.item = ExternalContentItem.objects.create(
+            url="https://example.gov.uk/first",
+            title="First",
+            source=self.source,
+        )
+        other_item = ExternalContentItem.objects.create(
+            url="https://example.gov.uk/other",
+            title="Other",
+        )
+        ExternalContentItem.add_tags_to_items([self.item.pk], [self.tag])
+        ExternalContentItem.add_tags_to_items([other_item.pk], [other_tag])
+
+    def _context(self, **params):
+        request = RequestFactory().get(self.page.url, params)
+        return self.page.get_context(request)
+
+    def test_lists_items_for_configured_tags(self):
+        context = self._context()
+
+        self.assertEqual(list(context["listing_items"]), [self.item])
+        self.assertEqual(context["available_tags"], [self.tag])
+        self.assertEqual(
+            context["available_sources"],
+            [{"id": str(self.source.pk), "label": "Example blog"}],
+        )
+
+    def test_loads_configured_tags_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            context = self._context()
+            list(context["listing_items"])
+
+        tag_queries = [
+            query["sql"] for query in queries if 'FROM "govuk_govuktag"' in query["sql"]
+        ]
+        self.assertEqual(len(tag_queries), 1)
+
+    def test_source_labels_fall_back_to_trimmed_url(self):
+        unnamed_source = ContentDiscoverySource.objects.create(
+            settings=self.source.settings,
+            sort_order=1,
+            name="  ",
+            url="https://another.gov.uk/feed.xml",
+        )
+        item = ExternalContentItem.objects.create(
+            url="https://another.gov.uk/post",
+            title="Another",
+            source=unnamed_source,
+        )
+        ExternalContentItem.add_tags_to_items([item.pk], [self.tag])
+
+        context = self._context()
+
+        self.assertEqual(
+            context["available_sources"],
+            [
+                {"id": str(self.source.pk), "label": "Example blog"},
+                {
+                    "id": str(unnamed_source.pk),
+                    "label": "https://another.gov.uk/feed.xml",
+                },
+            ],
+        )
+
+    def test_listing_items_include_their_source(self):
+        items = list(self._context()["listing_items"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual([item.source.name for item in items], ["Example blog"])
+
+    def test_listing_queryset_reuses_loaded_tags(self):
+        page = TagListingsPage.objects.get(pk=self.page.pk)
+        list(page.get_listing_queryset())
+
+        with self.assertNumQueries(1):
+            self.assertEqual(list(page.get_listing_queryset()), [self.item])
+
+    def test_filters_by_selected_tag_and_source(self):
+        self.page.enable_tag_filter = True
+        self.page.enable_source_filter = True
+
+        context = self._context(tag="NEWS", source=str(self.source.pk))
+        self.assertEqual(context["selected_tag"], self.tag)
+        self.assertEqual(context["selected_source_label"], "Example blog")
+        self.assertEqual(list(context["listing_items"]), [self.item])
+
+        context = self._context(tag="missing", source="0")
+        self.assertIsNone(context["selected_tag"])
+        self.assertEqual(context["selected_source_id"], "")
+
+    def test_ignores_malformed_source_filter(self):
+        self.page.enable_source_filter = True
+
+        context = self._context(source="not-a-number")
+
+        self.assertEqual(context["selected_source_id"], "")
+        self.assertEqual(list(context["listing_items"]), [self.item])
+
+    def test_counts_items_matching_several_tags_once(self):
+        second_tag = GovukTag.objects.create(slug="blogs", name="Blogs")
+        TagListingsPageTag.objects.create(content_object=self.page, tag=second_tag)
+        ExternalContentItem.add_tags_to_items([self.item.pk], [second_tag])
+        page = TagListingsPage.objects.get(pk=self.page.pk)
+
+        context = page.get_context(RequestFactory().get(page.url))
+
+        self.assertEqual(context["listing_items"].paginator.count, 1)
+        self.assertEqual(list(context["listing_items"]), [self.item])
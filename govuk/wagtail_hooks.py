@@ -358,7 +358,7 @@ def sync_content_discovery_source_view(request, source_id: int):
     redirect_url = _safe_next_url(request, fallback_url=fallback_url)
 
     try:
-        result = sync_content_discovery_source(source)
+        result = sync_content_discovery_source(source, force=True)
     except ContentDiscoveryError as exc:
         messages.error(request, f"Sync failed for '{source}': {exc}")
     else:
@@ -398,7 +398,7 @@ def sync_content_discovery_site_view(request, site_id: int):
     failed_sources: list[str] = []
     for source in sources:
         try:
-            result = sync_content_discovery_source(source)
+            result = sync_content_discovery_source(source, force=True)
         except ContentDiscoveryError as exc:
             failed_sources.append(f"{source}: {exc}")
             continue
@@ -447,6 +447,10 @@ def clear_content_discovery_site_view(request, site_id: int):
     ).distinct()
     item_count = queryset.count()
     queryset.delete()
+    # Forget HTTP cache validators so the next sync refetches every source.
+    ContentDiscoverySource.objects.filter(settings__site_id=site_id).update(
+        etag="", last_modified=""
+    )
 
     messages.warning(
         request,